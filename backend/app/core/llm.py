@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from beeai_framework.backend.chat import ChatModel
@@ -76,9 +77,25 @@ llm_retry = create_retry_decorator(
 )
 
 
+# Providers accepted in LLM_PROVIDER (ollama assumes a local server on the default port if not specified)
+_SUPPORTED_PROVIDERS = frozenset({"ollama", "watsonx", "openai"})
+
+
+@lru_cache(maxsize=8)
+def _build_llm(provider: str, model_name: str) -> ChatModel:
+    """Create the ChatModel for a provider and model (Cached)
+
+    Failed initializations raise and are not cached, so the next call retries.
+    """
+    logger.info("initializing_llm", provider=provider, model=model_name)
+    return ChatModel.from_name(f"{provider}:{model_name}")
+
+
 def get_llm() -> ChatModel:
     """Get LLM instance with error handling
 
+    The ChatModel for each (provider, model) pair is built once and reused.
+
     Returns:
         ChatModel instance
 
@@ -89,18 +106,11 @@ def get_llm() -> ChatModel:
         provider = os.getenv("LLM_PROVIDER", "ollama").lower()
         model_name = os.getenv("LLM_MODEL", "llama3.1")
 
-        logger.info("initializing_llm", provider=provider, model=model_name)
-
-        if provider == "ollama":
-            # Assumes Ollama is running locally on default port if not specified
-            return ChatModel.from_name(f"ollama:{model_name}")
-        elif provider == "watsonx":
-            return ChatModel.from_name(f"watsonx:{model_name}")
-        elif provider == "openai":
-            return ChatModel.from_name(f"openai:{model_name}")
-        else:
+        if provider not in _SUPPORTED_PROVIDERS:
             raise ValueError(f"Unsupported LLM_PROVIDER: {provider}")
 
+        return _build_llm(provider, model_name)
+
     except ValueError as e:
         logger.error("llm_initialization_failed", error=str(e), provider=provider)
         raise LLMError(f"Failed to initialize LLM: {e}") from e
@@ -2,6 +2,7 @@
 
 import logging
 import re
+from functools import lru_cache
 
 import structlog
 from pythonjsonlogger.json import JsonFormatter
@@ -24,6 +25,10 @@ class SensitiveDataFilter(logging.Filter):
         (re.compile(r"[a-zA-Z0-9_-]{44,}", re.IGNORECASE), "***REDACTED_KEY***"),
     ]
 
+    # All patterns as one alternation: a single scan tells whether any of them can match. The substitutions
+    # themselves still run in order, since an earlier redaction may expose or hide text for a later pattern.
+    _ANY_SENSITIVE_RE = re.compile("|".join(pattern.pattern for pattern, _ in SENSITIVE_PATTERNS), re.IGNORECASE)
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter sensitive data from log records
 
@@ -34,34 +39,26 @@ class SensitiveDataFilter(logging.Filter):
             Always True (message is modified and passed through)
         """
         if hasattr(record, "msg") and isinstance(record.msg, str):
-            message = record.msg
-            for pattern, replacement in self.SENSITIVE_PATTERNS:
-                message = pattern.sub(replacement, message)
-            record.msg = message
+            record.msg = self._redact(record.msg)
 
         # Also process args
         if hasattr(record, "args") and record.args:
-            sanitized_args = []
-            for arg in record.args:
-                if isinstance(arg, str):
-                    for pattern, replacement in self.SENSITIVE_PATTERNS:
-                        arg = pattern.sub(replacement, arg)
-                sanitized_args.append(arg)
-            record.args = tuple(sanitized_args)
+            record.args = tuple(self._redact(arg) if isinstance(arg, str) else arg for arg in record.args)
 
         return True
 
+    def _redact(self, text: str) -> str:
+        """Apply every sensitive pattern to text (returns text itself when nothing matches)"""
+        if not self._ANY_SENSITIVE_RE.search(text):
+            return text
+        for pattern, replacement in self.SENSITIVE_PATTERNS:
+            text = pattern.sub(replacement, text)
+        return text
 
-def sanitize_dict(data: dict) -> dict:
-    """Redact sensitive data from dictionary
 
-    Args:
-        data: Dictionary to sanitize
-
-    Returns:
-        Sanitized dictionary
-    """
-    SENSITIVE_KEYS = {
+# Keys whose values are masked; matched as substrings of the key lowercased with "_" and "-" removed
+_SENSITIVE_KEYS = frozenset(
+    {
         "api_key",
         "apikey",
         "api-key",
@@ -78,24 +75,62 @@ def sanitize_dict(data: dict) -> dict:
         "ibm_api_key",
         "ibm_project_id",
     }
+)
+_SENSITIVE_KEY_RE = re.compile("|".join(map(re.escape, sorted(_SENSITIVE_KEYS))))
 
-    sanitized = {}
-    for key, value in data.items():
-        key_lower = key.lower().replace("_", "").replace("-", "")
 
+@lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str) -> bool:
+    """Check whether a dictionary key names sensitive data (Cached)"""
+    return _SENSITIVE_KEY_RE.search(key.lower().replace("_", "").replace("-", "")) is not None
+
+
+def sanitize_dict(data: dict) -> dict:
+    """Redact sensitive data from dictionary
+
+    Dictionaries and lists with nothing to redact are returned as-is; only the
+    branches that change are copied, so the input is never modified.
+
+    Args:
+        data: Dictionary to sanitize
+
+    Returns:
+        Sanitized dictionary
+    """
+    sanitized = None
+    for key, value in data.items():
         # Mask if sensitive key
-        if any(sensitive in key_lower for sensitive in SENSITIVE_KEYS):
-            sanitized[key] = "***REDACTED***"
+        if _is_sensitive_key(key):
+            new_value = "***REDACTED***"
         # Recursively process nested dictionaries
         elif isinstance(value, dict):
-            sanitized[key] = sanitize_dict(value)
+            new_value = sanitize_dict(value)
         # Process each item if list
         elif isinstance(value, list):
-            sanitized[key] = [sanitize_dict(item) if isinstance(item, dict) else item for item in value]
+            new_value = _sanitize_list(value)
         else:
-            sanitized[key] = value
+            continue
+
+        if new_value is not value:
+            if sanitized is None:
+                sanitized = dict(data)
+            sanitized[key] = new_value
+
+    return data if sanitized is None else sanitized
+
+
+def _sanitize_list(items: list) -> list:
+    """Sanitize the dictionaries in a list, copying the list only if one of them changes"""
+    sanitized = None
+    for i, item in enumerate(items):
+        if isinstance(item, dict):
+            new_item = sanitize_dict(item)
+            if new_item is not item:
+                if sanitized is None:
+                    sanitized = list(items)
+                sanitized[i] = new_item
 
-    return sanitized
+    return items if sanitized is None else sanitized
 
 
 class SensitiveDataProcessor:
@@ -1,4 +1,6 @@
+from collections import Counter
 from enum import Enum
+from functools import cached_property
 from typing import List, Optional
 
 from pydantic import BaseModel, Field, model_validator
@@ -183,6 +185,20 @@ class LayoutTypeDefinition(BaseModel):
     )
     max_text_capacity: int = Field(..., ge=0, description="Maximum total character count for this layout")
 
+    @cached_property
+    def description_head(self) -> tuple[str, ...]:
+        """First three words of the description (Cached)"""
+        return tuple(self.description.split()[:3])
+
+    @cached_property
+    def _placeholder_counts(self) -> Counter:
+        """Occurrences of each placeholder type in primary_placeholders (Cached)"""
+        return Counter(self.primary_placeholders)
+
+    def count_placeholder(self, kind: str) -> int:
+        """Number of primary placeholders of the given type (e.g. "BODY")"""
+        return self._placeholder_counts[kind]
+
 
 class LayoutIntelligenceBullet(BaseModel):
     """Bullet point with hierarchy for layout intelligence output."""
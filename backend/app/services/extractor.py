@@ -97,7 +97,7 @@ class ContentExtractor:
             "image_count": len(images),
             "filename": file_path.name,
         }
-        (extraction_dir / "metadata.json").write_text(json.dumps(metadata))
+        (extraction_dir / "metadata.json").write_bytes(self._serialize_metadata(metadata))
 
         self.logger.info(
             "content_extracted",
@@ -116,6 +116,17 @@ class ContentExtractor:
             warnings=warnings,
         )
 
+    def _serialize_metadata(self, metadata: dict) -> bytes:
+        """Serialize extraction metadata for the cleanup service.
+
+        Args:
+            metadata: Metadata dict (expires_at, image_count, filename)
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return json.dumps(metadata).encode("utf-8")
+
     def _extract_slide(
         self,
         slide,
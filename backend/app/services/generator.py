@@ -1,8 +1,13 @@
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
-from typing import List, Optional
+from pathlib import Path
+from typing import IO, List, Optional, Tuple, Union
 
 import requests
+import structlog
 from lxml import etree
 from PIL import Image
 from pptx import Presentation
@@ -12,14 +17,59 @@ from pptx.enum.chart import XL_CHART_TYPE
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.oxml.ns import qn
 
-from app.schemas import ChartData, SlideContent
+from app.schemas import BulletPoint, ChartData, SlideContent
+
+logger = structlog.get_logger(__name__)
+
+# CJK punctuation, Hiragana, Katakana, CJK unified ideographs, full/half-width forms
+_JAPANESE_RE = re.compile("[\u3000-\u303f\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf\uff00-\uffef]")
+
+# Upper bound on concurrent image downloads per generate() call
+_IMAGE_FETCH_WORKERS = 8
+
+# Placeholder types that can hold body text (bullets)
+_BODY_TYPES = frozenset({PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT})
+
+# Placeholder types that can take a picture, in order of preference
+_PICTURE_TYPES = (PP_PLACEHOLDER.PICTURE, PP_PLACEHOLDER.OBJECT, PP_PLACEHOLDER.BODY)
+
+# Map chart type string (ChartData.type) to XL_CHART_TYPE enum; add more names as needed
+_CHART_TYPE_MAP = {name: XL_CHART_TYPE[name] for name in ("COLUMN_CLUSTERED", "BAR_CLUSTERED", "LINE", "PIE", "AREA")}
+
+
+def _str_bullet(item: str):
+    return item, 0
+
+
+def _bullet_point_bullet(item: BulletPoint):
+    return item.text, item.level
+
+
+# Exact-type dispatch for populate_bullets items (str or BulletPoint); other types are skipped
+_BULLET_HANDLERS = {str: _str_bullet, BulletPoint: _bullet_point_bullet}
+
+
+@lru_cache(maxsize=8)
+def _load_template_bytes(template_path: str, mtime_ns: int) -> bytes:
+    """Read template file bytes, keyed by path and mtime (Cached)"""
+    # mtime_ns is only part of the cache key, so a re-uploaded template gets a fresh entry
+    with open(template_path, "rb") as f:
+        return f.read()
 
 
 class SlidePopulator:
     def __init__(self, slide, strict=False):
         self.slide = slide
         self.strict = strict
-        self.errors = []
+        # (%-format template, args) pairs; formatted only when errors is read
+        self._errors = []
+        # Lazily built {placeholder idx: placeholder} index for fallback lookups
+        self._ph_by_idx = None
+
+    @property
+    def errors(self) -> List[str]:
+        """Error messages collected while populating the slide"""
+        return [template % args for template, args in self._errors]
 
     def safe_get_placeholder(self, idx: int, fallback_idx: int = None):
         """Get placeholder with fallback index support"""
@@ -33,11 +83,15 @@ class SlidePopulator:
                     pass
 
             # Try to find by index if idx lookup fails (pure fallback)
-            for ph in self.slide.placeholders:
-                if ph.placeholder_format.idx == idx:
-                    return ph
-
-            self.errors.append(f"No placeholder with idx={idx} (fallback={fallback_idx})")
+            if self._ph_by_idx is None:
+                self._ph_by_idx = {}
+                for ph in self.slide.placeholders:
+                    self._ph_by_idx.setdefault(ph.placeholder_format.idx, ph)
+            ph = self._ph_by_idx.get(idx)
+            if ph is not None:
+                return ph
+
+            self._errors.append(("No placeholder with idx=%s (fallback=%s)", (idx, fallback_idx)))
             return None
 
     def validate_content_type(self, placeholder, content_type: str) -> bool:
@@ -61,16 +115,7 @@ class SlidePopulator:
         return ph_type in valid_mappings.get(content_type, [])
 
     def _contains_japanese(self, text: str) -> bool:
-        for char in text:
-            if (
-                "\u3000" <= char <= "\u303f"
-                or "\u3040" <= char <= "\u309f"
-                or "\u30a0" <= char <= "\u30ff"
-                or "\u4e00" <= char <= "\u9faf"
-                or "\uff00" <= char <= "\uffef"
-            ):
-                return True
-        return False
+        return _JAPANESE_RE.search(text) is not None
 
     def set_japanese_font(self, run, font_name="Meiryo UI"):
         """Set East Asian font using XML manipulation"""
@@ -85,7 +130,7 @@ class SlidePopulator:
             # Also set formatting for latin text just in case
             run.font.name = font_name
         except Exception as e:
-            self.errors.append(f"Failed to set Japanese font: {e}")
+            self._errors.append(("Failed to set Japanese font: %s", (e,)))
 
     def replace_text_preserve_format(self, paragraph, new_text):
         """Replace text in first run only, preserving all formatting"""
@@ -97,15 +142,10 @@ class SlidePopulator:
             return
 
         # Keep only first run, preserve its formatting
-        # Removing subsequent runs
+        # Removing subsequent runs and line breaks, which would otherwise survive around the new text
         p = paragraph._p
-        first_run_found = False
-        for elm in list(p):
-            if elm.tag.endswith("r") and not elm.tag.endswith("Pr"):  # is a run (and not pPr)
-                if not first_run_found:
-                    first_run_found = True
-                    continue
-                p.remove(elm)
+        for elm in p.xpath("./a:r[position()>1] | ./a:br"):
+            p.remove(elm)
 
         # Update first run
         if paragraph.runs:
@@ -114,30 +154,28 @@ class SlidePopulator:
             if self._contains_japanese(new_text):
                 self.set_japanese_font(run)
 
-    def insert_picture_fit(self, placeholder, image_data: bytes):
+    def insert_picture_fit(self, placeholder, image_data: bytes, image_size: Optional[Tuple[int, int]] = None):
         """Insert image fitted within placeholder, preserving aspect ratio"""
         try:
-            im = Image.open(BytesIO(image_data))
-            image_width, image_height = im.size
+            # Image.open is lazy and only parses the header here. Never call load()/convert():
+            # python-pptx embeds the original bytes, so only the size is needed.
+            # image_size lets callers that already measured the image (e.g. the prefetch pool) skip this.
+            image_width, image_height = image_size or Image.open(BytesIO(image_data)).size
 
             picture = placeholder.insert_picture(BytesIO(image_data))
 
             # Reset cropping
             picture.crop_top = picture.crop_left = picture.crop_bottom = picture.crop_right = 0
 
-            # Calculate aspect ratios
-            placeholder_ratio = float(picture.width) / float(picture.height)
+            # Shrink to fit: only the dimension that overflows the image's aspect ratio changes
             image_ratio = float(image_width) / float(image_height)
-
-            # Shrink to fit
-            if placeholder_ratio > image_ratio:
-                picture.width = int(image_ratio * picture.height)
-            else:
-                picture.height = int(picture.width / image_ratio)
+            width, height = picture.width, picture.height
+            picture.width = int(min(width, image_ratio * height))
+            picture.height = int(min(height, width / image_ratio))
 
             return picture
         except Exception as e:
-            self.errors.append(f"Image processing failed: {e}")
+            self._errors.append(("Image processing failed: %s", (e,)))
             return None
 
     def set_theme_color(self, run, theme_color_name: str):
@@ -149,33 +187,33 @@ class SlidePopulator:
             color_enum = getattr(MSO_THEME_COLOR, theme_color_name, MSO_THEME_COLOR.ACCENT_1)
             run.font.color.theme_color = color_enum
         except Exception as e:
-            self.errors.append(f"Failed to set theme color {theme_color_name}: {e}")
+            self._errors.append(("Failed to set theme color %s: %s", (theme_color_name, e)))
 
     def populate_bullets(self, placeholder, bullets, theme_color=None):
         """Populate text frame with bullets (strings or BulletPoint objects)"""
+        if not bullets:
+            # Nothing to write; leave the text frame untouched
+            return
+
         tf = placeholder.text_frame
         tf.clear()
 
-        print(f"[Populator] populate_bullets called with {len(bullets) if bullets else 0} items")
-        print(f"[Populator] bullets type: {type(bullets)}")
-        if bullets:
-            print(f"[Populator] First item type: {type(bullets[0])}")
-            print(f"[Populator] First item: {bullets[0]}")
+        logger.debug(
+            "populate_bullets_started",
+            item_count=len(bullets),
+            bullets_type=type(bullets).__name__,
+            first_item_type=type(bullets[0]).__name__,
+        )
 
         for item in bullets:
             p = tf.add_paragraph()
 
-            if isinstance(item, str):
-                text = item
-                level = 0
-                print(f"[Populator] Processing string: {text}")
-            elif hasattr(item, "text"):  # BulletPoint object
-                text = item.text
-                level = item.level
-                print(f"[Populator] Processing BulletPoint: {text} (level {level})")
-            else:
-                print(f"[Populator] Skipping unknown item type: {type(item)}")
+            handler = _BULLET_HANDLERS.get(type(item))
+            if handler is None:
+                logger.debug("bullet_item_skipped", item_type=type(item).__name__)
                 continue
+            text, level = handler(item)
+            logger.debug("bullet_item_processed", item_type=type(item).__name__, level=level)
 
             p.text = text
             p.level = level
@@ -195,18 +233,8 @@ class SlidePopulator:
     def insert_chart(self, placeholder, chart_data: ChartData):
         """Insert a chart into the placeholder"""
         try:
-            # Map chart type string to XL_CHART_TYPE enum
-            chart_type_map = {
-                "COLUMN_CLUSTERED": XL_CHART_TYPE.COLUMN_CLUSTERED,
-                "BAR_CLUSTERED": XL_CHART_TYPE.BAR_CLUSTERED,
-                "LINE": XL_CHART_TYPE.LINE,
-                "PIE": XL_CHART_TYPE.PIE,
-                "AREA": XL_CHART_TYPE.AREA,
-                # Add more mappings as needed
-            }
-
             # Default to COLUMN_CLUSTERED if type not found or invalid
-            xl_chart_type = chart_type_map.get(chart_data.type.upper(), XL_CHART_TYPE.COLUMN_CLUSTERED)
+            xl_chart_type = _CHART_TYPE_MAP.get(chart_data.type.upper(), XL_CHART_TYPE.COLUMN_CLUSTERED)
 
             # Create chart data object
             # Note: CategoryChartData works for Column, Bar, Line, Area.
@@ -229,55 +257,146 @@ class SlidePopulator:
                 pass  # Some chart types or layouts might not support title easily or raise error
 
         except Exception as e:
-            self.errors.append(f"Failed to insert chart: {e}")
+            self._errors.append(("Failed to insert chart: %s", (e,)))
+
+
+def _fetch_image(url: str):
+    """Download an image and read its pixel size off the header.
+
+    Returns (response, (width, height) or None), or the exception raised while downloading.
+    Runs on the prefetch pool, so nothing here may touch the Presentation.
+    """
+    try:
+        # stream=True defers the body, so error responses are closed without downloading it
+        resp = requests.get(url, timeout=10, stream=True)  # 10s timeout
+        if resp.status_code != 200:
+            resp.close()
+            return resp, None
+        content = resp.content  # Read once; the BytesIO below shares this buffer rather than copying it
+    except Exception as e:
+        return e
+    try:
+        image_size = Image.open(BytesIO(content)).size
+    except Exception:
+        image_size = None  # insert_picture_fit re-reads the header and records the error
+    return resp, image_size
 
 
 class PresentationGenerator:
-    def _find_placeholder(self, slide, prefer_types: List[PP_PLACEHOLDER]) -> Optional[object]:
-        """Find the best matching placeholder based on type priority"""
+    def _classify_placeholders(self, slide) -> Tuple[dict, List[object]]:
+        """Walk slide.placeholders once.
+
+        Returns the first placeholder of each type and the ordered BODY/OBJECT
+        placeholders that have a text frame, so every populate step shares one scan.
+        """
+        first_by_type = {}
+        body_placeholders = []
+        for ph in slide.placeholders:
+            ph_type = ph.placeholder_format.type
+            first_by_type.setdefault(ph_type, ph)
+            if ph_type in _BODY_TYPES and ph.has_text_frame:
+                body_placeholders.append(ph)
+        return first_by_type, body_placeholders
+
+    @staticmethod
+    def _pick_placeholder(first_by_type: dict, prefer_types: List[PP_PLACEHOLDER]) -> Optional[object]:
+        """Pick the best matching placeholder from classified placeholders based on type priority"""
         for ph_type in prefer_types:
-            for ph in slide.placeholders:
-                if ph.placeholder_format.type == ph_type:
-                    return ph
+            if ph_type in first_by_type:
+                return first_by_type[ph_type]
         return None
 
+    def _prefetch_images(self, added_slides: List[tuple]) -> dict:
+        """Download and measure slide images concurrently before population.
+
+        Only http(s) URLs on slides with a placeholder that can take a picture are fetched.
+        Returns a mapping of URL to (response, image size) or the exception raised while fetching.
+        Slides themselves are still populated serially, as python-pptx objects are not thread-safe.
+        """
+        urls = list(
+            dict.fromkeys(
+                slide_content.image_url
+                for slide_content, _, placeholders_by_type, _ in added_slides
+                if slide_content.image_url
+                and slide_content.image_url.startswith(("http://", "https://"))
+                and self._pick_placeholder(placeholders_by_type, _PICTURE_TYPES) is not None
+            )
+        )
+        if not urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(_IMAGE_FETCH_WORKERS, len(urls))) as pool:
+            return dict(zip(urls, pool.map(_fetch_image, urls), strict=True))
+
     def _find_all_body_placeholders(self, slide) -> List[object]:
         """Find all BODY and OBJECT placeholders on a slide.
 
         Returns placeholders in order they appear in the slide.
         Used for Two-Column layouts where multiple BODY placeholders exist.
         """
-        body_placeholders = []
-        for ph in slide.placeholders:
-            ph_type = ph.placeholder_format.type
-            if ph_type in [PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT]:
-                if ph.has_text_frame:
-                    body_placeholders.append(ph)
-        return body_placeholders
+        return self._classify_placeholders(slide)[1]
+
+    def generate(
+        self,
+        template_path: Union[str, IO[bytes]],
+        slides: List[SlideContent],
+        output_path: Union[str, IO[bytes]],
+    ) -> Union[str, IO[bytes]]:
+        """Render slides onto the template and save the result.
+
+        Both template_path and output_path may be filesystem paths or binary
+        file-like objects (e.g. BytesIO), which python-pptx reads and writes directly.
+        """
+        prs = self.build_presentation(template_path, slides)
+        if isinstance(output_path, str):
+            # Serialize in memory, then write the file in one call instead of per zip entry
+            buffer = BytesIO()
+            prs.save(buffer)
+            Path(output_path).write_bytes(buffer.getvalue())
+        else:
+            prs.save(output_path)
+        return output_path
 
-    def generate(self, template_path: str, slides: List[SlideContent], output_path: str) -> str:
-        if not os.path.exists(template_path):
-            raise FileNotFoundError(f"Template not found: {template_path}")
+    def build_presentation(self, template_path: Union[str, IO[bytes]], slides: List[SlideContent]):
+        """Render slides onto the template and return the in-memory Presentation without saving it."""
+        if isinstance(template_path, str):
+            # A single stat both checks existence and keys the template cache
+            try:
+                mtime_ns = os.stat(template_path).st_mtime_ns
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"Template not found: {template_path}") from e
+            template_path = BytesIO(_load_template_bytes(template_path, mtime_ns))
 
         prs = Presentation(template_path)
         master = prs.slide_masters[0]  # Default to first master
 
         # Clear ALL existing slides first
-        print(f"[Generator] Template has {len(prs.slides)} existing slides")
+        logger.debug("template_slides_found", slide_count=len(prs.slides))
         while len(prs.slides) > 0:
             rId = prs.slides._sldIdLst[0].rId
             prs.part.drop_rel(rId)
             del prs.slides._sldIdLst[0]
-        print(f"[Generator] Cleared all slides. Now have {len(prs.slides)} slides")
+        logger.debug("template_slides_cleared", slide_count=len(prs.slides))
 
+        # Add and classify every slide first, so only images that have a placeholder to go into are downloaded
+        added_slides = []
         for slide_content in slides:
             # Layout selection
             if slide_content.layout_index >= len(master.slide_layouts):
-                print(f"Warning: Layout index {slide_content.layout_index} out of range. Skipping slide.")
+                logger.warning(
+                    "layout_index_out_of_range",
+                    layout_index=slide_content.layout_index,
+                    layout_count=len(master.slide_layouts),
+                    slide_title=slide_content.title,
+                )
                 continue
 
             layout = master.slide_layouts[slide_content.layout_index]
             slide = prs.slides.add_slide(layout)
+            added_slides.append((slide_content, slide, *self._classify_placeholders(slide)))
+
+        prefetched_images = self._prefetch_images(added_slides)
+
+        for slide_content, slide, placeholders_by_type, body_placeholders in added_slides:
             populator = SlidePopulator(slide)
 
             # 1. Handle Title
@@ -290,9 +409,7 @@ class PresentationGenerator:
 
             # Check if this is a Two-Column layout (has bullets_right)
             if slide_content.bullets_right:
-                # Two-Column layout: find all BODY placeholders
-                body_placeholders = self._find_all_body_placeholders(slide)
-
+                # Two-Column layout: use all BODY placeholders
                 if len(body_placeholders) >= 2:
                     # Two placeholders available: populate left and right columns
                     if bullets_to_use:
@@ -302,62 +419,65 @@ class PresentationGenerator:
                     )
                 elif len(body_placeholders) == 1:
                     # Graceful degradation: only one placeholder, append right bullets to left
-                    print(
-                        "Warning: Two-Column layout requested but only one BODY placeholder found. "
-                        "Appending right bullets to left column."
+                    logger.warning(
+                        "two_column_single_body_placeholder",
+                        slide_title=slide_content.title,
+                        message="Appending right bullets to left column",
                     )
                     combined_bullets = list(bullets_to_use) if bullets_to_use else []
                     combined_bullets.extend(slide_content.bullets_right)
                     populator.populate_bullets(body_placeholders[0], combined_bullets, slide_content.theme_color)
                 else:
-                    print(
-                        f"Warning: No suitable placeholder found for Two-Column text on slide '{slide_content.title}'"
-                    )
+                    logger.warning("placeholder_not_found", content="two_column_text", slide_title=slide_content.title)
             elif bullets_to_use:
                 # Standard single-column layout
-                body_placeholder = self._find_placeholder(slide, [PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT])
+                body_placeholder = self._pick_placeholder(
+                    placeholders_by_type, [PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT]
+                )
                 if body_placeholder and body_placeholder.has_text_frame:
                     populator.populate_bullets(body_placeholder, bullets_to_use, slide_content.theme_color)
                 else:
-                    print(f"Warning: No suitable placeholder found for text on slide '{slide_content.title}'")
+                    logger.warning("placeholder_not_found", content="text", slide_title=slide_content.title)
 
             # 3. Handle Image
             if slide_content.image_url:
                 # Priority: PICTURE > OBJECT > BODY
-                pic_placeholder = self._find_placeholder(
-                    slide, [PP_PLACEHOLDER.PICTURE, PP_PLACEHOLDER.OBJECT, PP_PLACEHOLDER.BODY]
-                )
+                pic_placeholder = self._pick_placeholder(placeholders_by_type, _PICTURE_TYPES)
 
                 if pic_placeholder:
                     try:
                         # Validate URL simple check
                         if not slide_content.image_url.startswith(("http://", "https://")):
-                            print(f"Invalid image URL: {slide_content.image_url}")
+                            logger.warning("invalid_image_url", url=slide_content.image_url)
                             continue
 
-                        resp = requests.get(slide_content.image_url, timeout=10)  # 10s timeout
+                        fetched = prefetched_images[slide_content.image_url]
+                        if isinstance(fetched, Exception):
+                            raise fetched
+                        resp, image_size = fetched
                         if resp.status_code == 200:
                             # If fallback to BODY, insert_picture might simply work if it's a placeholder?
                             # python-pptx placeholders usually have insert_picture method.
-                            populator.insert_picture_fit(pic_placeholder, resp.content)
+                            populator.insert_picture_fit(pic_placeholder, resp.content, image_size)
                         else:
-                            print(f"Failed to fetch image: status {resp.status_code}")
+                            logger.warning(
+                                "image_fetch_failed", url=slide_content.image_url, status_code=resp.status_code
+                            )
                     except Exception as e:
-                        print(f"Failed to fetch/insert image: {e}")
+                        logger.warning("image_insert_failed", url=slide_content.image_url, error=str(e))
                 else:
-                    print(f"Warning: No suitable placeholder found for image on slide '{slide_content.title}'")
+                    logger.warning("placeholder_not_found", content="image", slide_title=slide_content.title)
 
             # 4. Handle Chart
             if slide_content.chart:
                 # Priority: CHART > OBJECT > BODY
-                chart_placeholder = self._find_placeholder(
-                    slide, [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT, PP_PLACEHOLDER.BODY]
+                chart_placeholder = self._pick_placeholder(
+                    placeholders_by_type, [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT, PP_PLACEHOLDER.BODY]
                 )
 
                 if chart_placeholder:
                     populator.insert_chart(chart_placeholder, slide_content.chart)
                 else:
-                    print(f"Warning: No suitable placeholder found for chart on slide '{slide_content.title}'")
+                    logger.warning("placeholder_not_found", content="chart", slide_title=slide_content.title)
 
-        prs.save(output_path)
-        return output_path
+        return prs
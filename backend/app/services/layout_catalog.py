@@ -5,95 +5,113 @@ can select from. These definitions are technology-agnostic and describe layout
 purposes, not specific PowerPoint template layouts.
 """
 
-from typing import List
+from functools import cache, cached_property
+from typing import TYPE_CHECKING
 
 from app.schemas import LayoutTypeDefinition
 
-# Canonical catalog of all 7 abstract layout types
-# These are the layout types the LLM can choose from when structuring content
-LAYOUT_CATALOG: List[LayoutTypeDefinition] = [
-    LayoutTypeDefinition(
-        id=1,
-        name="Title Slide",
-        description="Opening slide with presentation title and optional subtitle. No bullet points.",
-        primary_placeholders=["TITLE", "SUBTITLE"],
-        recommended_bullet_count=(0, 0),
-        recommended_text_length=(10, 100),
-        max_text_capacity=150,
-    ),
-    LayoutTypeDefinition(
-        id=2,
-        name="Title + Bullets",
-        description=(
-            "Standard content slide with title and bullet points. "
-            "Most common layout for presenting lists, steps, or key points."
+if TYPE_CHECKING:
+    # Resolved lazily through the module __getattr__ below
+    LAYOUT_CATALOG: tuple[LayoutTypeDefinition, ...]
+
+
+@cache
+def _layout_catalog() -> tuple[LayoutTypeDefinition, ...]:
+    """Build the canonical catalog of all 7 abstract layout types (Cached)
+
+    These are the layout types the LLM can choose from when structuring content.
+    Built on first access rather than at import.
+    """
+    return (
+        LayoutTypeDefinition(
+            id=1,
+            name="Title Slide",
+            description="Opening slide with presentation title and optional subtitle. No bullet points.",
+            primary_placeholders=["TITLE", "SUBTITLE"],
+            recommended_bullet_count=(0, 0),
+            recommended_text_length=(10, 100),
+            max_text_capacity=150,
         ),
-        primary_placeholders=["TITLE", "BODY"],
-        recommended_bullet_count=(3, 7),
-        recommended_text_length=(100, 500),
-        max_text_capacity=800,
-    ),
-    LayoutTypeDefinition(
-        id=3,
-        name="Section Header",
-        description=(
-            "Section divider slide with large title text. Used to introduce new topics or chapters. No bullet points."
+        LayoutTypeDefinition(
+            id=2,
+            name="Title + Bullets",
+            description=(
+                "Standard content slide with title and bullet points. "
+                "Most common layout for presenting lists, steps, or key points."
+            ),
+            primary_placeholders=["TITLE", "BODY"],
+            recommended_bullet_count=(3, 7),
+            recommended_text_length=(100, 500),
+            max_text_capacity=800,
         ),
-        primary_placeholders=["TITLE"],
-        recommended_bullet_count=(0, 0),
-        recommended_text_length=(10, 80),
-        max_text_capacity=120,
-    ),
-    LayoutTypeDefinition(
-        id=4,
-        name="Two-Column",
-        description=(
-            "Comparison or parallel content slide with title and two side-by-side bullet columns. "
-            "Use for comparisons, pros/cons, before/after, or parallel concepts. "
-            "Columns should be balanced (max 2 items difference)."
+        LayoutTypeDefinition(
+            id=3,
+            name="Section Header",
+            description=(
+                "Section divider slide with large title text. "
+                "Used to introduce new topics or chapters. No bullet points."
+            ),
+            primary_placeholders=["TITLE"],
+            recommended_bullet_count=(0, 0),
+            recommended_text_length=(10, 80),
+            max_text_capacity=120,
         ),
-        primary_placeholders=["TITLE", "BODY", "BODY"],
-        recommended_bullet_count=(4, 10),
-        recommended_text_length=(150, 600),
-        max_text_capacity=900,
-    ),
-    LayoutTypeDefinition(
-        id=5,
-        name="Quote/Highlight",
-        description=(
-            "Emphasis slide with title and single prominent text block. "
-            "Use for quotes, key takeaways, or important statements. No bullet points."
+        LayoutTypeDefinition(
+            id=4,
+            name="Two-Column",
+            description=(
+                "Comparison or parallel content slide with title and two side-by-side bullet columns. "
+                "Use for comparisons, pros/cons, before/after, or parallel concepts. "
+                "Columns should be balanced (max 2 items difference)."
+            ),
+            primary_placeholders=["TITLE", "BODY", "BODY"],
+            recommended_bullet_count=(4, 10),
+            recommended_text_length=(150, 600),
+            max_text_capacity=900,
         ),
-        primary_placeholders=["TITLE", "BODY"],
-        recommended_bullet_count=(0, 0),
-        recommended_text_length=(20, 200),
-        max_text_capacity=300,
-    ),
-    LayoutTypeDefinition(
-        id=6,
-        name="Bullets Only",
-        description=(
-            "Content-dense slide with bullet points but no title. "
-            "Use when title is implied from previous context or for continuation slides."
+        LayoutTypeDefinition(
+            id=5,
+            name="Quote/Highlight",
+            description=(
+                "Emphasis slide with title and single prominent text block. "
+                "Use for quotes, key takeaways, or important statements. No bullet points."
+            ),
+            primary_placeholders=["TITLE", "BODY"],
+            recommended_bullet_count=(0, 0),
+            recommended_text_length=(20, 200),
+            max_text_capacity=300,
         ),
-        primary_placeholders=["BODY"],
-        recommended_bullet_count=(5, 10),
-        recommended_text_length=(150, 600),
-        max_text_capacity=800,
-    ),
-    LayoutTypeDefinition(
-        id=7,
-        name="Summary/Conclusion",
-        description=(
-            "Closing slide with title and concise bullet points summarizing key takeaways. "
-            "Similar to Title + Bullets but with emphasis on brevity."
+        LayoutTypeDefinition(
+            id=6,
+            name="Bullets Only",
+            description=(
+                "Content-dense slide with bullet points but no title. "
+                "Use when title is implied from previous context or for continuation slides."
+            ),
+            primary_placeholders=["BODY"],
+            recommended_bullet_count=(5, 10),
+            recommended_text_length=(150, 600),
+            max_text_capacity=800,
         ),
-        primary_placeholders=["TITLE", "BODY"],
-        recommended_bullet_count=(3, 5),
-        recommended_text_length=(80, 300),
-        max_text_capacity=500,
-    ),
-]
+        LayoutTypeDefinition(
+            id=7,
+            name="Summary/Conclusion",
+            description=(
+                "Closing slide with title and concise bullet points summarizing key takeaways. "
+                "Similar to Title + Bullets but with emphasis on brevity."
+            ),
+            primary_placeholders=["TITLE", "BODY"],
+            recommended_bullet_count=(3, 5),
+            recommended_text_length=(80, 300),
+            max_text_capacity=500,
+        ),
+    )
+
+
+def __getattr__(name: str):
+    if name == "LAYOUT_CATALOG":
+        return _layout_catalog()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class LayoutTemplateCatalog:
@@ -106,15 +124,20 @@ class LayoutTemplateCatalog:
 
     def __init__(self):
         """Initialize the catalog with the canonical layout definitions."""
-        self._catalog = LAYOUT_CATALOG
+        # Immutable and shared, so get_all_layouts() can hand it out without copying
+        self._catalog = _layout_catalog()
+        # Precomputed columns so callers don't re-walk the layouts for IDs or names
+        self.ids: tuple[int, ...] = tuple(layout.id for layout in self._catalog)
+        self.names: tuple[str, ...] = tuple(layout.name for layout in self._catalog)
 
-    def get_all_layouts(self) -> List[LayoutTypeDefinition]:
+    def get_all_layouts(self) -> tuple[LayoutTypeDefinition, ...]:
         """Get all 7 layout type definitions.
 
         Returns:
-            List of all layout type definitions in ID order (1-7)
+            Tuple of all layout type definitions in ID order (1-7). The same
+            tuple is returned on every call; it cannot be mutated by callers.
         """
-        return self._catalog.copy()
+        return self._catalog
 
     def get_layout_by_id(self, layout_type_id: int) -> LayoutTypeDefinition:
         """Get a specific layout type definition by ID.
@@ -144,11 +167,17 @@ class LayoutTemplateCatalog:
 
         Returns a formatted string describing all 7 layout types with their
         characteristics. This is used in the LLM prompt to help it select
-        appropriate layouts for content.
+        appropriate layouts for content. The catalog is immutable, so the
+        string is built once per instance and reused.
 
         Returns:
             Formatted string with all layout descriptions
         """
+        return self._prompt_context
+
+    @cached_property
+    def _prompt_context(self) -> str:
+        """Build the prompt context string (Cached)"""
         lines = ["Available Layout Types:"]
         lines.append("")
 
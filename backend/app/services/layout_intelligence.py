@@ -9,7 +9,7 @@ import re
 import secrets
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Optional, Type
+from typing import List, Optional, Sequence, Type
 
 import structlog
 from pydantic import BaseModel, ValidationError
@@ -114,7 +114,7 @@ class OverflowValidator:
     def validate(
         self,
         slides: List[LayoutIntelligenceSlide],
-        catalog: List[LayoutTypeDefinition],
+        catalog: Sequence[LayoutTypeDefinition],
     ) -> List[OverflowResult]:
         """Check each slide for capacity violations.
 
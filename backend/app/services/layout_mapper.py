@@ -4,7 +4,7 @@ Maps abstract layout type IDs (1-7) to template-specific layout indices by analy
 placeholder structure and applying fallback logic when exact matches aren't available.
 """
 
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Sequence, Tuple
 
 import structlog
 
@@ -23,6 +23,11 @@ FALLBACK_PRIORITY: Dict[int, List[int]] = {
     7: [2, 6],  # Summary → Title+Bullets → Bullets Only
 }
 
+# Full lookup order per type, the type itself first, flattened once at import
+FALLBACK_CHAINS: Dict[int, Tuple[int, ...]] = {
+    type_id: (type_id, *fallbacks) for type_id, fallbacks in FALLBACK_PRIORITY.items()
+}
+
 
 class LayoutTypeMapper:
     """Maps abstract layout type IDs to template-specific layout indices.
@@ -32,7 +37,7 @@ class LayoutTypeMapper:
     logic to ensure all layout types can be mapped.
     """
 
-    def build_mapping(self, layouts: List[LayoutInfo], catalog: List[LayoutTypeDefinition]) -> Dict[int, int]:
+    def build_mapping(self, layouts: List[LayoutInfo], catalog: Sequence[LayoutTypeDefinition]) -> Dict[int, int]:
         """Build a mapping from layout_type_id to layout_index.
 
         Analyzes each template layout's placeholder structure and matches it to
@@ -48,15 +53,19 @@ class LayoutTypeMapper:
         """
         mapping: Dict[int, int] = {}
 
-        for layout_type in catalog:
-            best_score = -1
-            best_index = 0
+        # Per-layout features extracted once as parallel columns, not once per (type, layout) pair
+        layout_indices = [layout.index for layout in layouts]
+        layout_placeholder_types = [frozenset(ph.type for ph in layout.placeholders) for layout in layouts]
+        layout_placeholder_counts = [len(layout.placeholders) for layout in layouts]
+        layout_names = [layout.name.lower() for layout in layouts]
 
-            for layout in layouts:
-                score = self._score_layout_match(layout, layout_type)
-                if score > best_score:
-                    best_score = score
-                    best_index = layout.index
+        for layout_type in catalog:
+            # One row of the type x layout score matrix. Layouts may be shared between types, so the
+            # per-row argmax is already the optimal assignment; ties keep the earliest layout and a
+            # row with nothing above -1 falls back to index 0.
+            scores = self._score_layouts(layout_type, layout_placeholder_types, layout_placeholder_counts, layout_names)
+            best_score = max(scores, default=-1)
+            best_index = layout_indices[scores.index(best_score)] if best_score > -1 else 0
 
             mapping[layout_type.id] = best_index
 
@@ -70,8 +79,14 @@ class LayoutTypeMapper:
 
         return mapping
 
-    def _score_layout_match(self, layout: LayoutInfo, layout_type: LayoutTypeDefinition) -> int:
-        """Score how well a template layout matches an abstract layout type.
+    def _score_layouts(
+        self,
+        layout_type: LayoutTypeDefinition,
+        placeholder_types: Sequence[FrozenSet[str]],
+        placeholder_counts: Sequence[int],
+        layout_names: Sequence[str],
+    ) -> List[int]:
+        """Score how well each template layout matches an abstract layout type.
 
         Scoring algorithm:
         - +10 points per matching placeholder type
@@ -79,43 +94,30 @@ class LayoutTypeMapper:
         - +5 points if layout name contains keywords from type name
 
         Args:
-            layout: Template layout to score
             layout_type: Abstract layout type definition
+            placeholder_types: Placeholder types present in each template layout
+            placeholder_counts: Number of placeholders in each template layout
+            layout_names: Lowercased name of each template layout
 
         Returns:
-            Score (higher is better)
+            Scores in template layout order (higher is better)
         """
-        score = 0
-
-        # Extract placeholder types from template layout
-        template_placeholder_types = [ph.type for ph in layout.placeholders]
-
-        # Count matching placeholder types (+10 per match)
-        for expected_type in layout_type.primary_placeholders:
-            if expected_type in template_placeholder_types:
-                score += 10
-
-        # Penalize placeholder count difference (-3 per extra/missing)
-        count_diff = abs(len(template_placeholder_types) - len(layout_type.primary_placeholders))
-        score -= count_diff * 3
-
-        # Bonus for name similarity (+5 if keywords match)
-        layout_name_lower = layout.name.lower()
-        type_name_lower = layout_type.name.lower()
+        expected_types = layout_type.primary_placeholders
+        expected_count = len(expected_types)
 
         # Extract keywords from type name (split on spaces and common separators)
         type_keywords = [
             word
-            for word in type_name_lower.replace("/", " ").replace("-", " ").split()
+            for word in layout_type.name.lower().replace("/", " ").replace("-", " ").split()
             if len(word) > 3  # Only consider words longer than 3 chars
         ]
 
-        for keyword in type_keywords:
-            if keyword in layout_name_lower:
-                score += 5
-                break  # Only apply bonus once
-
-        return score
+        return [
+            10 * sum(expected_type in present for expected_type in expected_types)
+            - 3 * abs(count - expected_count)
+            + (5 if any(keyword in name for keyword in type_keywords) else 0)  # Bonus applied once
+            for present, count, name in zip(placeholder_types, placeholder_counts, layout_names, strict=True)
+        ]
 
     def map_type_to_index(self, layout_type_id: int, mapping: Dict[int, int]) -> int:
         """Resolve a single layout_type_id to layout_index using pre-built mapping.
@@ -133,29 +135,28 @@ class LayoutTypeMapper:
         Raises:
             ValueError: If no compatible layout exists after exhausting fallback chain
         """
-        # Try direct mapping first
-        if layout_type_id in mapping:
-            return mapping[layout_type_id]
-
-        # Try fallback chain
-        fallback_chain = FALLBACK_PRIORITY.get(layout_type_id, [])
+        # Direct mapping first, then the fallback chain, in one walk
+        for candidate_type_id in FALLBACK_CHAINS.get(layout_type_id, (layout_type_id,)):
+            layout_index = mapping.get(candidate_type_id)
+            if layout_index is None:
+                continue
 
-        for fallback_type_id in fallback_chain:
-            if fallback_type_id in mapping:
+            if candidate_type_id != layout_type_id:
                 logger.warning(
                     "layout_type_fallback",
                     requested_type=layout_type_id,
-                    fallback_type=fallback_type_id,
-                    layout_index=mapping[fallback_type_id],
+                    fallback_type=candidate_type_id,
+                    layout_index=layout_index,
                     message=(
-                        f"Layout type {layout_type_id} not found in template, using fallback type {fallback_type_id}"
+                        f"Layout type {layout_type_id} not found in template, using fallback type {candidate_type_id}"
                     ),
                 )
-                return mapping[fallback_type_id]
+            return layout_index
 
         # No compatible layout found
         raise ValueError(
-            f"No compatible layout found for type {layout_type_id}. Attempted fallback chain: {fallback_chain}"
+            f"No compatible layout found for type {layout_type_id}. "
+            f"Attempted fallback chain: {FALLBACK_PRIORITY.get(layout_type_id, [])}"
         )
 
 
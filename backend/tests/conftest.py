@@ -12,6 +12,25 @@ import pytest
 from pptx import Presentation
 from pptx.enum.shapes import PP_PLACEHOLDER
 
+# =============================================================================
+# Logging Fixture
+# =============================================================================
+
+
+@pytest.fixture(scope="session", autouse=True)
+def structured_logging():
+    """
+    Configure structlog the way app.main does at import time.
+
+    Services log through structlog's stdlib logger factory, so caplog only sees their
+    events once this has run; doing it here keeps that independent of which test
+    module happened to import app.main first.
+    """
+    from app.core.logging import configure_logging
+
+    configure_logging()
+
+
 # =============================================================================
 # Rate Limiter Reset Fixture
 # =============================================================================
@@ -34,13 +53,76 @@ def reset_rate_limiter():
     limiter.reset()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def no_llm_retry_wait():
+    """
+    Retry LLM calls immediately instead of sleeping through the exponential backoff.
+
+    call_llm_with_retry is decorated at import time, so its tenacity wait strategy is
+    swapped for the whole session; attempt counts and retried exception types are unchanged.
+    """
+    from tenacity import wait_none
+
+    from app.core.llm import call_llm_with_retry
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(call_llm_with_retry.retry, "wait", wait_none())
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_cache():
+    """
+    Drop cached ChatModel instances so each test sees get_llm() build from its own environment and patches.
+    """
+    from app.core.llm import _build_llm
+
+    _build_llm.cache_clear()
+    yield
+    _build_llm.cache_clear()
+
+
+# =============================================================================
+# API Client Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    TestClient for the FastAPI app, shared by the tests of one module.
+
+    Entering the client runs the app lifespan, so startup happens once per module
+    instead of once per test.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 # =============================================================================
 # File-Based Fixtures
 # =============================================================================
 
 
+@pytest.fixture(scope="session")
+def sample_pptx_bytes():
+    """
+    Build the default PPTX template once per session.
+
+    Returns the raw bytes of a blank python-pptx presentation so that
+    per-test fixtures can copy it to disk without rebuilding it.
+    """
+    buffer = BytesIO()
+    Presentation().save(buffer)
+    return buffer.getvalue()
+
+
 @pytest.fixture
-def sample_pptx(tmp_path):
+def sample_pptx(sample_pptx_bytes, tmp_path):
     """
     Create a minimal PPTX file for testing.
 
@@ -48,27 +130,38 @@ def sample_pptx(tmp_path):
     cleaned up after the test.
     """
     filename = tmp_path / "test_template.pptx"
-    prs = Presentation()
-    prs.save(str(filename))
+    filename.write_bytes(sample_pptx_bytes)
     return str(filename)
 
 
-@pytest.fixture
-def sample_pptx_with_content(tmp_path):
+@pytest.fixture(scope="session")
+def sample_pptx_with_content_bytes(sample_pptx_bytes):
     """
-    Create a PPTX file with a title slide for testing.
+    Build the PPTX template with a title slide once per session.
 
-    Returns the path to a temporary PPTX file with actual content.
+    Returns the raw bytes so per-test fixtures only copy them to disk.
     """
-    filename = tmp_path / "test_template_with_content.pptx"
-    prs = Presentation()
+    prs = Presentation(BytesIO(sample_pptx_bytes))
     # Add a title slide
     slide_layout = prs.slide_layouts[0]  # Title Slide layout
     slide = prs.slides.add_slide(slide_layout)
     title = slide.shapes.title
     if title:
         title.text = "Test Presentation"
-    prs.save(str(filename))
+    buffer = BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def sample_pptx_with_content(sample_pptx_with_content_bytes, tmp_path):
+    """
+    Create a PPTX file with a title slide for testing.
+
+    Returns the path to a temporary PPTX file with actual content.
+    """
+    filename = tmp_path / "test_template_with_content.pptx"
+    filename.write_bytes(sample_pptx_with_content_bytes)
     return str(filename)
 
 
@@ -255,6 +348,57 @@ def mock_llm():
     return mock
 
 
+class StubLLM:
+    """
+    Minimal stand-in for a ChatModel whose ainvoke records calls and replays scripted outcomes.
+
+    Each outcome is returned, or raised if it is an exception; the last one repeats once the
+    script runs out. Cheaper than a MagicMock/AsyncMock pair for tests that only call ainvoke.
+    """
+
+    def __init__(self, outcomes):
+        self._outcomes = list(outcomes)
+        self.calls = []
+
+    async def ainvoke(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        outcome = self._outcomes[min(len(self.calls), len(self._outcomes)) - 1]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def make_stub_llm(ret=None, exc=None, outcomes=None):
+    """
+    Factory function to create StubLLM instances.
+
+    Args:
+        ret: Value returned by every ainvoke call
+        exc: Exception raised by every ainvoke call (takes precedence over ret)
+        outcomes: Per-call sequence of return values and exceptions (takes precedence over both)
+
+    Returns:
+        A StubLLM whose calls attribute lists (args, kwargs) for each ainvoke call
+    """
+    if outcomes is None:
+        outcomes = [exc if exc is not None else ret]
+    return StubLLM(outcomes)
+
+
+@pytest.fixture
+def stub_llm_factory():
+    """
+    Provide the stub LLM factory function as a fixture.
+
+    Usage:
+        def test_something(stub_llm_factory):
+            llm = stub_llm_factory(ret="response")
+            ...
+            assert llm.calls == [(("prompt",), {})]
+    """
+    return make_stub_llm
+
+
 # =============================================================================
 # Research Agent Fixtures
 # =============================================================================
@@ -4,13 +4,44 @@ Target coverage: 90%
 """
 
 import json
-from unittest.mock import MagicMock, patch
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
 from app.schemas import AnalysisMode
 from app.services.extractor import ContentExtractor
 
+# Keep extractor tests on one xdist worker (``-n auto --dist loadgroup``) so their fixtures are built once.
+pytestmark = pytest.mark.xdist_group("extractor")
+
+
+@pytest.fixture
+def mock_presentation(monkeypatch):
+    """Replace the Presentation class used by the extractor with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr("app.services.extractor.Presentation", mock)
+    return mock
+
+
+@pytest.fixture
+def extracted_images_dir(tmp_path, monkeypatch):
+    """Point EXTRACTED_IMAGES_DIR at a scratch directory.
+
+    Uses a RAM-backed directory under /dev/shm when available so the metadata
+    writes done by extract() never hit a slow disk; falls back to tmp_path.
+    """
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        with tempfile.TemporaryDirectory(dir=shm, prefix="pytest-extract-") as scratch:
+            monkeypatch.setattr("app.services.extractor.EXTRACTED_IMAGES_DIR", Path(scratch))
+            yield Path(scratch)
+    else:
+        monkeypatch.setattr("app.services.extractor.EXTRACTED_IMAGES_DIR", tmp_path)
+        yield tmp_path
+
 
 class TestContentExtractor:
     """Tests for the ContentExtractor class."""
@@ -25,30 +56,23 @@ class TestContentExtractor:
         assert extractor.base_url == "http://localhost:8000"
 
     @pytest.mark.asyncio
-    async def test_extract_creates_extraction_directory(self, tmp_path, monkeypatch):
+    async def test_extract_creates_extraction_directory(self, extracted_images_dir, mock_presentation):
         """Test that extraction creates necessary directories."""
-        # Mock EXTRACTED_IMAGES_DIR
-        monkeypatch.setattr("app.services.extractor.EXTRACTED_IMAGES_DIR", tmp_path)
-
         # Create a minimal mock presentation
-        with patch("app.services.extractor.Presentation") as mock_prs:
-            mock_prs.return_value.slides = []
-            result = await self.extractor.extract(tmp_path / "test.pptx", AnalysisMode.CONTENT)
+        mock_presentation.return_value.slides = []
+        result = await self.extractor.extract(extracted_images_dir / "test.pptx", AnalysisMode.CONTENT)
 
         # Verify directory was created
-        extraction_dir = tmp_path / result.extraction_id
+        extraction_dir = extracted_images_dir / result.extraction_id
         assert extraction_dir.exists()
         assert (extraction_dir / "images").exists()
         assert (extraction_dir / "metadata.json").exists()
 
     @pytest.mark.asyncio
-    async def test_extract_returns_valid_result(self, tmp_path, monkeypatch):
+    async def test_extract_returns_valid_result(self, extracted_images_dir, mock_presentation):
         """Test that extract returns valid ContentExtractionResult."""
-        monkeypatch.setattr("app.services.extractor.EXTRACTED_IMAGES_DIR", tmp_path)
-
-        with patch("app.services.extractor.Presentation") as mock_prs:
-            mock_prs.return_value.slides = []
-            result = await self.extractor.extract(tmp_path / "test.pptx", AnalysisMode.CONTENT)
+        mock_presentation.return_value.slides = []
+        result = await self.extractor.extract(extracted_images_dir / "test.pptx", AnalysisMode.CONTENT)
 
         assert result.extraction_id is not None
         assert result.filename == "test.pptx"
@@ -58,15 +82,12 @@ class TestContentExtractor:
         assert isinstance(result.warnings, list)
 
     @pytest.mark.asyncio
-    async def test_extract_saves_metadata(self, tmp_path, monkeypatch):
+    async def test_extract_saves_metadata(self, extracted_images_dir, mock_presentation):
         """Test that metadata is saved correctly."""
-        monkeypatch.setattr("app.services.extractor.EXTRACTED_IMAGES_DIR", tmp_path)
+        mock_presentation.return_value.slides = []
+        result = await self.extractor.extract(extracted_images_dir / "test.pptx", AnalysisMode.CONTENT)
 
-        with patch("app.services.extractor.Presentation") as mock_prs:
-            mock_prs.return_value.slides = []
-            result = await self.extractor.extract(tmp_path / "test.pptx", AnalysisMode.CONTENT)
-
-        metadata_path = tmp_path / result.extraction_id / "metadata.json"
+        metadata_path = extracted_images_dir / result.extraction_id / "metadata.json"
         metadata = json.loads(metadata_path.read_text())
 
         assert "expires_at" in metadata
@@ -74,6 +95,17 @@ class TestContentExtractor:
         assert "filename" in metadata
         assert metadata["filename"] == "test.pptx"
 
+    @pytest.mark.asyncio
+    async def test_extract_uses_metadata_serializer(self, extracted_images_dir, mock_presentation, monkeypatch):
+        """Test that metadata.json is written through the _serialize_metadata seam."""
+        monkeypatch.setattr(self.extractor, "_serialize_metadata", lambda metadata: b'{"custom": true}')
+
+        mock_presentation.return_value.slides = []
+        result = await self.extractor.extract(extracted_images_dir / "test.pptx", AnalysisMode.CONTENT)
+
+        metadata_path = extracted_images_dir / result.extraction_id / "metadata.json"
+        assert json.loads(metadata_path.read_bytes()) == {"custom": True}
+
     def test_extract_text_from_shape(self):
         """Test text extraction from shape."""
         mock_shape = MagicMock()
@@ -135,9 +167,7 @@ class TestContentExtractor:
         (extraction_dir / "images").mkdir()
 
         mock_shape = MagicMock()
-        mock_shape.image = property(lambda self: (_ for _ in ()).throw(AttributeError("no image")))
-
-        # Simulate AttributeError
+        # Simulate AttributeError on .image access
         del mock_shape.image
 
         result = self.extractor._extract_image(
@@ -190,12 +220,10 @@ class TestContentExtractor:
         assert "Video not supported" in warning
 
     @pytest.mark.asyncio
-    async def test_template_mode_skips_content(self, tmp_path, monkeypatch):
+    async def test_template_mode_skips_content(self, extracted_images_dir, mock_presentation):
         """Test that template mode skips content extraction."""
         from pptx.enum.shapes import MSO_SHAPE_TYPE
 
-        monkeypatch.setattr("app.services.extractor.EXTRACTED_IMAGES_DIR", tmp_path)
-
         # Create mock slide with shapes
         mock_slide = MagicMock()
         mock_shape = MagicMock()
@@ -207,9 +235,8 @@ class TestContentExtractor:
         mock_slide.shapes = [mock_shape]
         mock_slide.slide_layout.slide_master.slide_layouts.index.return_value = 1
 
-        with patch("app.services.extractor.Presentation") as mock_prs:
-            mock_prs.return_value.slides = [mock_slide]
-            result = await self.extractor.extract(tmp_path / "test.pptx", AnalysisMode.TEMPLATE)
+        mock_presentation.return_value.slides = [mock_slide]
+        result = await self.extractor.extract(extracted_images_dir / "test.pptx", AnalysisMode.TEMPLATE)
 
         # In template mode, body_text should be empty
         assert len(result.slides) == 1
@@ -251,7 +278,6 @@ class TestExtractSlideEdgeCases:
         mock_shape = MagicMock()
         mock_shape.is_placeholder = False
         mock_shape.has_text_frame = True
-        mock_shape.text_frame.paragraphs = property(lambda self: (_ for _ in ()).throw(RuntimeError("shape error")))
         # Force exception via has_text_frame True but broken paragraphs access
         del mock_shape.text_frame.paragraphs
         mock_shape.shape_type = MSO_SHAPE_TYPE.AUTO_SHAPE
@@ -338,12 +364,10 @@ class TestExtractSlideEdgeCases:
         assert result.categories == []
 
     @pytest.mark.asyncio
-    async def test_extract_multiple_slides_with_content(self, tmp_path, monkeypatch):
+    async def test_extract_multiple_slides_with_content(self, extracted_images_dir, mock_presentation):
         """Test extraction with multiple slides containing various content."""
         from pptx.enum.shapes import MSO_SHAPE_TYPE
 
-        monkeypatch.setattr("app.services.extractor.EXTRACTED_IMAGES_DIR", tmp_path)
-
         # Create mock slides
         mock_slide1 = MagicMock()
         mock_text_shape = MagicMock()
@@ -361,21 +385,18 @@ class TestExtractSlideEdgeCases:
         mock_slide2.shapes = []
         mock_slide2.slide_layout.slide_master.slide_layouts.index.return_value = 1
 
-        with patch("app.services.extractor.Presentation") as mock_prs:
-            mock_prs.return_value.slides = [mock_slide1, mock_slide2]
-            result = await self.extractor.extract(tmp_path / "test.pptx", AnalysisMode.CONTENT)
+        mock_presentation.return_value.slides = [mock_slide1, mock_slide2]
+        result = await self.extractor.extract(extracted_images_dir / "test.pptx", AnalysisMode.CONTENT)
 
         assert len(result.slides) == 2
         assert result.slides[0].body_text == ["Content text"]
         assert result.slides[1].body_text == []
 
     @pytest.mark.asyncio
-    async def test_extract_group_shape_graceful_skip(self, tmp_path, monkeypatch):
+    async def test_extract_group_shape_graceful_skip(self, extracted_images_dir, mock_presentation):
         """Test that group shapes are skipped gracefully."""
         from pptx.enum.shapes import MSO_SHAPE_TYPE
 
-        monkeypatch.setattr("app.services.extractor.EXTRACTED_IMAGES_DIR", tmp_path)
-
         mock_slide = MagicMock()
         mock_group = MagicMock()
         mock_group.shape_type = MSO_SHAPE_TYPE.GROUP
@@ -386,9 +407,8 @@ class TestExtractSlideEdgeCases:
         mock_slide.shapes = [mock_group]
         mock_slide.slide_layout.slide_master.slide_layouts.index.return_value = 0
 
-        with patch("app.services.extractor.Presentation") as mock_prs:
-            mock_prs.return_value.slides = [mock_slide]
-            result = await self.extractor.extract(tmp_path / "test.pptx", AnalysisMode.CONTENT)
+        mock_presentation.return_value.slides = [mock_slide]
+        result = await self.extractor.extract(extracted_images_dir / "test.pptx", AnalysisMode.CONTENT)
 
         # Should extraction successful but empty content
         assert len(result.slides) == 1
@@ -1,4 +1,3 @@
-from io import BytesIO
 from unittest.mock import MagicMock
 
 import pytest
@@ -12,15 +11,14 @@ def create_upload_file(filename: str, content: bytes, content_type: str):
     file = MagicMock()
     file.filename = filename
     file.content_type = content_type
-    file.file = BytesIO(content)
 
     # Make read async
     async def async_read():
         return content
 
-    # Make seek async
+    # Make seek async; validation only rewinds, content is returned by read() directly
     async def async_seek(pos):
-        return file.file.seek(pos)
+        return None
 
     file.read = async_read
     file.seek = async_seek
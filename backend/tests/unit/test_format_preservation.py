@@ -3,7 +3,17 @@ from unittest.mock import Mock
 from pptx.enum.shapes import PP_PLACEHOLDER
 
 from app.schemas import BulletPoint, SlideContent
-from app.services.generator import PresentationGenerator, SlidePopulator
+from app.services.generator import SlidePopulator
+
+# Shared read-only inputs; tests never mutate these models.
+_BULLETS_NESTED = [
+    BulletPoint(text="Level 0", level=0),
+    BulletPoint(text="Level 1", level=1),
+    BulletPoint(text="Level 0 again", level=0),
+]
+_CONTENT_NESTED = SlideContent(
+    layout_index=0, title="Test", bullets=[BulletPoint(text="Main", level=0), BulletPoint(text="Sub", level=1)]
+)
 
 
 def test_populate_bullets_nested():
@@ -14,12 +24,6 @@ def test_populate_bullets_nested():
 
     populator = SlidePopulator(Mock())
 
-    bullets = [
-        BulletPoint(text="Level 0", level=0),
-        BulletPoint(text="Level 1", level=1),
-        BulletPoint(text="Level 0 again", level=0),
-    ]
-
     # Create distinct mock paragraphs
     p0 = Mock()
     p0.runs = [Mock()]
@@ -30,7 +34,7 @@ def test_populate_bullets_nested():
 
     mock_tf.add_paragraph.side_effect = [p0, p1, p2]
 
-    populator.populate_bullets(mock_placeholder, bullets)
+    populator.populate_bullets(mock_placeholder, _BULLETS_NESTED)
 
     assert mock_tf.add_paragraph.call_count == 3
 
@@ -79,8 +83,6 @@ class MockPlaceholder:
 
 def test_generator_handles_nested_bullets():
     """Integration-like test for generator handling nested bullets"""
-    generator = PresentationGenerator()
-
     # Mock slide and shape tree
     mock_slide = Mock()
     mock_slide.shapes.title = None
@@ -89,16 +91,8 @@ def test_generator_handles_nested_bullets():
     body_ph = MockPlaceholder(PP_PLACEHOLDER.BODY, 1)
     mock_slide.placeholders = [body_ph]
 
-    # Mock find_placeholder mechanism: PresentationGenerator._find_placeholder
-    # We can't easily mock internal method of instance under test without patching class
-    # But we can assume it works if we provide correct placeholders list.
-
-    generator._find_placeholder = Mock(return_value=body_ph)
-
     # Create content with nested bullets and verify structure
-    content = SlideContent(
-        layout_index=0, title="Test", bullets=[BulletPoint(text="Main", level=0), BulletPoint(text="Sub", level=1)]
-    )
+    content = _CONTENT_NESTED
     # Verify the nested bullet structure
     assert len(content.bullets) == 2
     assert content.bullets[0].level == 0
@@ -1,6 +1,7 @@
+import logging
 import os
 from io import BytesIO
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from PIL import Image
@@ -8,12 +9,35 @@ from pptx import Presentation
 from pptx.enum.shapes import PP_PLACEHOLDER
 
 from app.schemas import SlideContent
-from app.services.generator import PresentationGenerator, SlidePopulator
+from app.services.generator import PresentationGenerator, SlidePopulator, _fetch_image, _load_template_bytes
 
-# Note: sample_pptx fixture is provided by conftest.py
+GENERATOR_LOGGER = "app.services.generator"
 
+# Note: sample_pptx and sample_pptx_bytes fixtures are provided by conftest.py
 
-def test_generate_presentation(sample_pptx, tmp_path):
+
+def _png_bytes(size, color):
+    """Encode a solid-colour RGB image as PNG bytes."""
+    buffer = BytesIO()
+    Image.new("RGB", size, color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+# Encoded once at import; shared by the insert_picture_fit tests
+_RED_50_PNG = _png_bytes((50, 50), "red")
+
+# Attributes insert_picture_fit touches on the inserted picture
+_PICTURE_SPEC = ["width", "height", "crop_top", "crop_left", "crop_bottom", "crop_right"]
+
+
+def _generate_to_bytes(generator, template_bytes, slides):
+    """Run generate() entirely in memory and return the rendered PPTX bytes."""
+    output = BytesIO()
+    generator.generate(BytesIO(template_bytes), slides, output)
+    return output.getvalue()
+
+
+def test_generate_presentation(sample_pptx_bytes):
     generator = PresentationGenerator()
 
     slides = [
@@ -25,56 +49,72 @@ def test_generate_presentation(sample_pptx, tmp_path):
         SlideContent(layout_index=1, title="Slide 2", bullet_points=["Point C"]),
     ]
 
+    # Verify content on the in-memory tree; no save/re-parse round-trip needed
+    prsk = generator.build_presentation(BytesIO(sample_pptx_bytes), slides)
+    assert len(prsk.slides) == 2
+    assert prsk.slides[0].shapes.title.text == "Slide 1"
+
+
+def test_generate_presentation_to_path(sample_pptx, tmp_path):
+    generator = PresentationGenerator()
+    slides = [SlideContent(layout_index=1, title="Slide 1", bullet_points=["Point A"])]
+
     output = str(tmp_path / "output_gen.pptx")
     generated_path = generator.generate(sample_pptx, slides, output)
 
+    assert generated_path == output
     assert os.path.exists(generated_path)
 
-    # Verify content
-    prsk = Presentation(generated_path)
-    assert len(prsk.slides) == 2
-    assert prsk.slides[0].shapes.title.text == "Slide 1"
 
+def test_generate_reuses_cached_template_bytes(sample_pptx, tmp_path):
+    generator = PresentationGenerator()
+    slides = [SlideContent(layout_index=1, title="Slide 1", bullet_points=["Point A"])]
+    _load_template_bytes.cache_clear()
+
+    generator.generate(sample_pptx, slides, str(tmp_path / "first.pptx"))
+    generator.generate(sample_pptx, slides, str(tmp_path / "second.pptx"))
+
+    info = _load_template_bytes.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
 
-def test_generate_invalid_template_path():
+
+def test_generate_invalid_template_path(tmp_path):
     generator = PresentationGenerator()
     with pytest.raises(FileNotFoundError):
-        generator.generate("non_existent.pptx", [], "out.pptx")
+        generator.generate(str(tmp_path / "non_existent.pptx"), [], str(tmp_path / "out.pptx"))
 
 
-@patch("builtins.print")
-def test_generate_invalid_layout_index(mock_print, sample_pptx, tmp_path):
+def test_generate_invalid_layout_index(sample_pptx, tmp_path, caplog):
     generator = PresentationGenerator()
     slides = [SlideContent(layout_index=99, title="T", bullet_points=[])]
 
     out = str(tmp_path / "out_warn.pptx")
-    generator.generate(sample_pptx, slides, out)
+    with caplog.at_level(logging.WARNING, logger=GENERATOR_LOGGER):
+        generator.generate(sample_pptx, slides, out)
 
-    # Check that it printed a warning
-    args, _ = mock_print.call_args
-    assert "Warning" in args[0]
+    # Check that it logged a warning
+    assert any("layout_index_out_of_range" in r.getMessage() for r in caplog.records if r.levelno == logging.WARNING)
 
     # Check correct completion (file exists, but maybe empty content for that slide)
     assert os.path.exists(out)
 
 
-@pytest.mark.parametrize("status_code", [404, 500])
-def test_generate_image_failure(sample_pptx, tmp_path, status_code):
+def test_generate_image_failure(sample_pptx_bytes):
     generator = PresentationGenerator()
     slides = [SlideContent(layout_index=1, title="Img", bullet_points=[], image_url="http://fail.com/img.png")]
 
-    # We need to ensure logic doesn't crash.
-    # We can mock requests.get
+    # We need to ensure logic doesn't crash for any non-200 response.
+    # Both codes take the same branch, so share one mock and template.
     with patch("requests.get") as mock_get:
-        mock_get.return_value = Mock(status_code=status_code)
+        for status_code in (404, 500):
+            mock_get.return_value = Mock(status_code=status_code)
 
-        out = str(tmp_path / "out_img_fail.pptx")
-        generator.generate(sample_pptx, slides, out)
+            out_bytes = _generate_to_bytes(generator, sample_pptx_bytes, slides)
 
-        assert os.path.exists(out)
-        prs = Presentation(out)
-        # Check that slide was created (even if image failed)
-        assert len(prs.slides) == 1
+            prs = Presentation(BytesIO(out_bytes))
+            # Check that slide was created (even if image failed)
+            assert len(prs.slides) == 1, f"status {status_code}"
 
 
 # --- SlidePopulator Tests ---
@@ -105,6 +145,24 @@ def test_safe_get_placeholder_fallback():
     assert populator.safe_get_placeholder(2) == mock_ph_correct
 
 
+def test_safe_get_placeholder_fallback_scans_once():
+    mock_slide = Mock()
+    ph_2 = Mock()
+    ph_2.placeholder_format.idx = 2
+    ph_3 = Mock()
+    ph_3.placeholder_format.idx = 3
+
+    mock_placeholders = Mock()
+    mock_placeholders.__getitem__ = Mock(side_effect=KeyError)
+    mock_placeholders.__iter__ = Mock(return_value=iter([ph_2, ph_3]))
+    mock_slide.placeholders = mock_placeholders
+
+    populator = SlidePopulator(mock_slide)
+    assert populator.safe_get_placeholder(2) == ph_2
+    assert populator.safe_get_placeholder(3) == ph_3
+    assert mock_placeholders.__iter__.call_count == 1
+
+
 def test_safe_get_placeholder_failure():
     mock_slide = Mock()
     mock_placeholders = Mock()
@@ -134,22 +192,15 @@ def test_replace_text_preserve_format_existing_runs():
     # Setup a paragraph with multiple runs
     # Structure: Paragraph has .runs list, and ._p element which has children
 
-    # We need to mock the underlying lxml structure slightly because the code iterates over p._p
+    # We need to mock the underlying lxml structure slightly because the code queries p._p for extra runs and breaks
 
     mock_p_element = Mock()
 
-    # Create mock elements for runs
-    r1 = Mock()
-    r1.tag = "...a:r"  # Ends with r
+    # Create a mock element for the second run
     r2 = Mock()
-    r2.tag = "...a:r"
 
-    # And maybe a non-run element
-    other = Mock()
-    other.tag = "...a:pPr"
-
-    # list(p) will return these
-    mock_p_element.__iter__ = Mock(return_value=iter([other, r1, r2]))
+    # The xpath query returns the runs after the first (and any a:br), never pPr
+    mock_p_element.xpath = Mock(return_value=[r2])
 
     mock_paragraph = Mock()
     mock_paragraph._p = mock_p_element
@@ -170,20 +221,34 @@ def test_replace_text_preserve_format_existing_runs():
     assert mock_run_1.text == "Updated"
 
 
+def test_replace_text_preserve_format_removes_line_breaks():
+    """Extra runs and <a:br> line breaks are dropped so only the new text remains"""
+    prs = Presentation()
+    textbox = prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_textbox(0, 0, 100, 100)
+    paragraph = textbox.text_frame.paragraphs[0]
+    paragraph.add_run().text = "one"
+    paragraph.add_line_break()
+    paragraph.add_run().text = "two"
+    paragraph.runs[0].font.bold = True
+
+    SlidePopulator(None).replace_text_preserve_format(paragraph, "X")
+
+    assert paragraph.text == "X"
+    assert len(paragraph.runs) == 1
+    assert paragraph.runs[0].font.bold is True
+
+
 def test_insert_picture_fit_success():
-    mock_placeholder = Mock()
-    mock_picture = Mock()
+    mock_placeholder = Mock(spec=["insert_picture"])
+    mock_picture = Mock(spec=_PICTURE_SPEC)
 
     # Assume 100x100 placeholder
     mock_picture.width = 1000
     mock_picture.height = 1000
     mock_placeholder.insert_picture.return_value = mock_picture
 
-    # Create valid image bytes (1x1 pixel)
-    img = Image.new("RGB", (50, 50), color="red")
-    img_byte_arr = BytesIO()
-    img.save(img_byte_arr, format="PNG")
-    img_bytes = img_byte_arr.getvalue()
+    # Valid 50x50 PNG image bytes
+    img_bytes = _RED_50_PNG
 
     populator = SlidePopulator(None)
     result = populator.insert_picture_fit(mock_placeholder, img_bytes)
@@ -197,27 +262,54 @@ def test_insert_picture_fit_resize_width():
     # Image is square (50x50, ratio 1.0)
     # ph_ratio (2.0) > img_ratio (1.0) -> width = img_ratio * height
 
-    mock_placeholder = Mock()
-    mock_picture = Mock()
+    mock_placeholder = Mock(spec=["insert_picture"])
+    mock_picture = Mock(spec=_PICTURE_SPEC)
     mock_picture.width = 200
     mock_picture.height = 100
 
     mock_placeholder.insert_picture.return_value = mock_picture
 
-    img = Image.new("RGB", (50, 50), color="red")
-    img_byte_arr = BytesIO()
-    img.save(img_byte_arr, format="PNG")
-    img_bytes = img_byte_arr.getvalue()
+    img_bytes = _RED_50_PNG
 
     populator = SlidePopulator(None)
     populator.insert_picture_fit(mock_placeholder, img_bytes)
 
     # Expectation: width becomes 1.0 * 100 = 100
     assert mock_picture.width == 100
+    assert mock_picture.height == 100
+
+
+def test_insert_picture_fit_resize_height():
+    # Placeholder is tall (100x200, ratio 0.5), image is square -> height = width / img_ratio
+    mock_placeholder = Mock(spec=["insert_picture"])
+    mock_picture = Mock(spec=_PICTURE_SPEC)
+    mock_picture.width = 100
+    mock_picture.height = 200
+    mock_placeholder.insert_picture.return_value = mock_picture
+
+    populator = SlidePopulator(None)
+    populator.insert_picture_fit(mock_placeholder, _RED_50_PNG)
+
+    assert (mock_picture.width, mock_picture.height) == (100, 100)
+
+
+def test_insert_picture_fit_uses_known_size():
+    mock_placeholder = Mock(spec=["insert_picture"])
+    mock_picture = Mock(spec=_PICTURE_SPEC)
+    mock_picture.width = 200
+    mock_picture.height = 100
+    mock_placeholder.insert_picture.return_value = mock_picture
+
+    populator = SlidePopulator(None)
+    with patch("app.services.generator.Image.open") as mock_open:
+        populator.insert_picture_fit(mock_placeholder, _RED_50_PNG, image_size=(50, 50))
+
+    mock_open.assert_not_called()
+    assert (mock_picture.width, mock_picture.height) == (100, 100)
 
 
 def test_insert_picture_fit_failure():
-    mock_placeholder = Mock()
+    mock_placeholder = Mock(spec=["insert_picture"])
     mock_placeholder.insert_picture.side_effect = Exception("Insert failed")
 
     populator = SlidePopulator(None)
@@ -226,9 +318,6 @@ def test_insert_picture_fit_failure():
     assert result is None
     assert len(populator.errors) > 0
     assert "Image processing failed" in populator.errors[0]
-    assert result is None
-    assert len(populator.errors) > 0
-    assert "Image processing failed" in populator.errors[0]
 
 
 def test_populate_bullets_mixed_content():
@@ -276,7 +365,7 @@ def test_insert_chart():
     populator = SlidePopulator(slide_mock)
 
     # Mock placeholder
-    placeholder = Mock()
+    placeholder = Mock(spec=["insert_chart"])
     placeholder.insert_chart = Mock()
     chart_obj = Mock()
     placeholder.insert_chart.return_value = chart_obj
@@ -305,19 +394,38 @@ def test_insert_chart():
     assert chart_obj.chart.chart_title.text_frame.text == "Sales"
 
 
-@patch("app.services.generator.Presentation")
-def test_generate_with_chart(mock_presentation):
-    # Setup mocks
-    prs = mock_presentation.return_value
-    slide = Mock()
-    prs.slides.add_slide.return_value = slide
-    slide.shapes.title = None  # Avoid title logic failure
+@pytest.fixture(scope="module")
+def fake_presentation_factory():
+    """Build the one-master, one-layout mock tree once per module.
 
-    # Setup master/layout
-    master = Mock()
+    Each call returns a fresh (prs, slide, layout) on top of the shared master;
+    the slide has no title shape so tests only need to attach the placeholders they exercise.
+    """
     layout = Mock()
+    master = Mock()
     master.slide_layouts = [layout]
-    prs.slide_masters = [master]
+
+    def _create():
+        slide = Mock()
+        slide.shapes.title = None  # Avoid title logic failure
+        prs = MagicMock()
+        prs.slides.add_slide.return_value = slide
+        prs.slide_masters = [master]
+        return prs, slide, layout
+
+    return _create
+
+
+@pytest.fixture
+def mocked_prs(fake_presentation_factory):
+    """Patch the generator's Presentation to return a fake from fake_presentation_factory."""
+    prs, slide, layout = fake_presentation_factory()
+    with patch("app.services.generator.Presentation", return_value=prs):
+        yield prs, slide, layout
+
+
+def test_generate_with_chart(mocked_prs, tmp_path):
+    _, slide, _ = mocked_prs
 
     # Setup placeholder for chart
     ph_chart = Mock()
@@ -325,7 +433,7 @@ def test_generate_with_chart(mock_presentation):
     slide.placeholders = [ph_chart]
 
     # Input Data
-    from app.schemas import ChartData, ChartSeries, SlideContent
+    from app.schemas import ChartData, ChartSeries
 
     slides_content = [
         SlideContent(
@@ -340,29 +448,20 @@ def test_generate_with_chart(mock_presentation):
         )
     ]
 
+    # Presentation is mocked, so the empty template file is never parsed
+    template = tmp_path / "dummy_template.pptx"
+    template.write_bytes(b"")
+
     gen = PresentationGenerator()
-    with patch("os.path.exists", return_value=True):
-        gen.generate("dummy_template.pptx", slides_content, "output.pptx")
+    gen.generate(str(template), slides_content, str(tmp_path / "output.pptx"))
 
     # Verify chart inserted
     ph_chart.insert_chart.assert_called()
 
 
-@patch("app.services.generator.Presentation")
-def test_generate_fallback_scenarios(mock_presentation):
+def test_generate_fallback_scenarios(mocked_prs, tmp_path, caplog):
     # Setup - a layout with NO Picture placeholder, but a BODY placeholder
-    prs = mock_presentation.return_value
-    slide = Mock()
-    slide.shapes.title = None
-
-    # Mock Master and Layouts
-    master = Mock()
-    layout = Mock()
-    master.slide_layouts = [layout]
-    prs.slide_masters = [master]
-
-    # Return slide when added
-    prs.slides.add_slide.return_value = slide
+    _, slide, _ = mocked_prs
 
     # Placeholder: type=BODY
     ph_body = Mock()
@@ -372,20 +471,18 @@ def test_generate_fallback_scenarios(mock_presentation):
     slide.placeholders = [ph_body]
 
     # 1. Test Image Fallback to BODY
-    from app.schemas import SlideContent
-
     slides_content = [
         SlideContent(layout_index=0, title="Fallback", bullet_points=[], image_url="http://valid.com/img.png")
     ]
 
+    # Presentation is mocked, so the empty template file is never parsed
+    template = tmp_path / "dummy.pptx"
+    template.write_bytes(b"")
+
     gen = PresentationGenerator()
 
     # Mock requests and insert_picture
-    with (
-        patch("os.path.exists", return_value=True),
-        patch("requests.get") as mock_get,
-        patch("builtins.print") as mock_print,
-    ):
+    with patch("requests.get") as mock_get, caplog.at_level(logging.DEBUG, logger=GENERATOR_LOGGER):
         mock_get.return_value = Mock(status_code=200, content=b"fakeimg")
         # We need populator to support insert_picture on this mock
         ph_body.insert_picture = Mock()
@@ -395,35 +492,45 @@ def test_generate_fallback_scenarios(mock_presentation):
         with patch("PIL.Image.open") as mock_img_open:
             mock_img_open.return_value = Mock(size=(100, 100))
 
-            gen.generate("dummy.pptx", slides_content, "out.pptx")
+            gen.generate(str(template), slides_content, str(tmp_path / "out.pptx"))
 
             # Verify body placeholder was used for image
             if not ph_body.insert_picture.called:
-                pytest.fail(f"insert_picture not called. Debug prints: {mock_print.call_args_list}")
+                pytest.fail(f"insert_picture not called. Debug logs: {caplog.messages}")
 
             ph_body.insert_picture.assert_called()
 
 
-def test_japanese_font_support():
-    slide = Mock()
-    populator = SlidePopulator(slide)
+@pytest.fixture(scope="module")
+def shared_populator():
+    """A populator for read-only helpers such as _contains_japanese."""
+    return SlidePopulator(Mock())
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [("Hello", False), ("こんにちは", True), ("Text with 漢字", True)],
+)
+def test_contains_japanese(shared_populator, text, expected):
+    assert shared_populator._contains_japanese(text) is expected
+
 
-    # Test _contains_japanese
-    assert populator._contains_japanese("Hello") is False
-    assert populator._contains_japanese("こんにちは") is True
-    assert populator._contains_japanese("Text with 漢字") is True
+def test_replace_text_preserve_format_japanese_font():
+    populator = SlidePopulator(Mock())
 
-    # Test replace_text_preserve_format
     p = Mock()
     run = Mock()
     p.runs = [run]
-    p._p = []  # Empty list for iteration
+    p._p.xpath.return_value = []  # No extra runs or breaks to remove
 
     populator.replace_text_preserve_format(p, "こんにちは")
     assert run.text == "こんにちは"
     assert run.font.name == "Meiryo UI"
 
-    # Test populate_bullets
+
+def test_populate_bullets_japanese_font():
+    populator = SlidePopulator(Mock())
+
     ph = Mock()
     p_bull = Mock()
     run_bull = Mock()
@@ -435,6 +542,21 @@ def test_japanese_font_support():
     assert run_bull.font.name == "Meiryo UI"
 
 
+def test_populate_bullets_japanese_font_failure_is_per_run():
+    """A run whose font cannot be set does not stop later runs from getting it"""
+    populator = SlidePopulator(Mock())
+
+    ph = Mock()
+    paragraphs = [Mock(runs=[Mock()]) for _ in range(2)]
+    paragraphs[0].runs[0]._r.get_or_add_rPr.side_effect = Exception("XML manipulation failed")
+    ph.text_frame.add_paragraph.side_effect = paragraphs
+
+    populator.populate_bullets(ph, ["日本語", "二つ目"])
+
+    assert paragraphs[1].runs[0].font.name == "Meiryo UI"
+    assert len(populator.errors) == 1
+
+
 def test_set_japanese_font_error_handling():
     """Test error handling when setting Japanese font fails"""
     slide = Mock()
@@ -515,12 +637,22 @@ def test_populate_bullets_unknown_item_type():
     assert mock_tf.add_paragraph.call_count == 2
 
 
+def test_populate_bullets_empty_skips_text_frame():
+    mock_ph = Mock()
+
+    populator = SlidePopulator(None)
+    populator.populate_bullets(mock_ph, [])
+
+    mock_ph.text_frame.clear.assert_not_called()
+    mock_ph.text_frame.add_paragraph.assert_not_called()
+
+
 def test_insert_chart_title_error():
     """Test chart insertion when setting title fails"""
     slide_mock = Mock()
     populator = SlidePopulator(slide_mock)
 
-    placeholder = Mock()
+    placeholder = Mock(spec=["insert_chart"])
     chart_obj = Mock()
     # Make chart title setting raise an exception
     chart_obj.chart.chart_title.text_frame.text = Mock(side_effect=Exception("Title not supported"))
@@ -547,7 +679,7 @@ def test_insert_chart_complete_failure():
     slide_mock = Mock()
     populator = SlidePopulator(slide_mock)
 
-    placeholder = Mock()
+    placeholder = Mock(spec=["insert_chart"])
     placeholder.insert_chart.side_effect = Exception("Chart insertion failed")
 
     from app.schemas import ChartData, ChartSeries
@@ -565,8 +697,7 @@ def test_insert_chart_complete_failure():
     assert "Failed to insert chart" in populator.errors[0]
 
 
-@patch("builtins.print")
-def test_generate_invalid_image_url(mock_print, sample_pptx, tmp_path):
+def test_generate_invalid_image_url(sample_pptx, tmp_path, caplog):
     """Test generation with invalid image URL (not http/https)"""
     generator = PresentationGenerator()
     slides = [
@@ -579,19 +710,18 @@ def test_generate_invalid_image_url(mock_print, sample_pptx, tmp_path):
     ]
 
     out = str(tmp_path / "out_invalid_url.pptx")
-    generator.generate(sample_pptx, slides, out)
+    with caplog.at_level(logging.WARNING, logger=GENERATOR_LOGGER):
+        generator.generate(sample_pptx, slides, out)
 
     # Should complete without crashing
     assert os.path.exists(out)
 
-    # Should have printed warning about invalid URL
-    print_calls = [str(call) for call in mock_print.call_args_list]
-    assert any("Invalid image URL" in call for call in print_calls)
+    # Should have logged warning about invalid URL
+    assert any("invalid_image_url" in r.getMessage() for r in caplog.records)
 
 
-@patch("builtins.print")
 @patch("requests.get")
-def test_generate_image_fetch_exception(mock_get, mock_print, sample_pptx, tmp_path):
+def test_generate_image_fetch_exception(mock_get, sample_pptx, tmp_path, caplog):
     """Test generation when image fetch raises exception"""
     mock_get.side_effect = Exception("Connection timeout")
 
@@ -606,18 +736,67 @@ def test_generate_image_fetch_exception(mock_get, mock_print, sample_pptx, tmp_p
     ]
 
     out = str(tmp_path / "out_fetch_error.pptx")
-    generator.generate(sample_pptx, slides, out)
+    with caplog.at_level(logging.WARNING, logger=GENERATOR_LOGGER):
+        generator.generate(sample_pptx, slides, out)
 
     # Should complete without crashing
     assert os.path.exists(out)
 
-    # Should have printed error message
-    print_calls = [str(call) for call in mock_print.call_args_list]
-    assert any("Failed to fetch/insert image" in call for call in print_calls)
+    # Should have logged error message
+    assert any("image_insert_failed" in r.getMessage() for r in caplog.records)
+
+
+@patch("requests.get")
+def test_generate_prefetches_each_image_once(mock_get, sample_pptx_bytes):
+    """Images are downloaded up front, once per distinct URL"""
+    mock_get.return_value = Mock(status_code=404)
+
+    generator = PresentationGenerator()
+    slides = [
+        SlideContent(layout_index=1, title="A", bullet_points=[], image_url="http://example.com/a.png"),
+        SlideContent(layout_index=1, title="B", bullet_points=[], image_url="http://example.com/b.png"),
+        SlideContent(layout_index=1, title="A again", bullet_points=[], image_url="http://example.com/a.png"),
+    ]
+
+    prs = generator.build_presentation(BytesIO(sample_pptx_bytes), slides)
+
+    assert len(prs.slides) == 3
+    fetched = sorted(call.args[0] for call in mock_get.call_args_list)
+    assert fetched == ["http://example.com/a.png", "http://example.com/b.png"]
 
 
-@patch("builtins.print")
-def test_generate_chart_no_placeholder(mock_print, sample_pptx, tmp_path):
+@patch("requests.get")
+def test_generate_skips_prefetch_without_picture_placeholder(mock_get, sample_pptx_bytes, caplog):
+    """Images on slides with nowhere to put them are never downloaded"""
+    generator = PresentationGenerator()
+    slides = [SlideContent(layout_index=0, title="Title only", bullet_points=[], image_url="http://example.com/a.png")]
+
+    with caplog.at_level(logging.WARNING, logger=GENERATOR_LOGGER):
+        prs = generator.build_presentation(BytesIO(sample_pptx_bytes), slides)
+
+    assert len(prs.slides) == 1
+    mock_get.assert_not_called()
+    assert any(
+        "placeholder_not_found" in r.getMessage() and '"content": "image"' in r.getMessage() for r in caplog.records
+    )
+
+
+@patch("requests.get")
+def test_fetch_image_streams_and_skips_error_bodies(mock_get):
+    error_resp = Mock(status_code=404)
+    mock_get.return_value = error_resp
+
+    assert _fetch_image("http://example.com/missing.png") == (error_resp, None)
+    mock_get.assert_called_once_with("http://example.com/missing.png", timeout=10, stream=True)
+    error_resp.close.assert_called_once()
+
+    mock_get.return_value = Mock(status_code=200, content=_RED_50_PNG)
+    resp, image_size = _fetch_image("http://example.com/red.png")
+    assert resp.content == _RED_50_PNG
+    assert image_size == (50, 50)
+
+
+def test_generate_chart_no_placeholder(sample_pptx, tmp_path, caplog):
     """Test generation when no suitable chart placeholder is found"""
     from app.schemas import ChartData, ChartSeries
 
@@ -637,14 +816,16 @@ def test_generate_chart_no_placeholder(mock_print, sample_pptx, tmp_path):
     ]
 
     out = str(tmp_path / "out_no_chart_ph.pptx")
-    generator.generate(sample_pptx, slides, out)
+    with caplog.at_level(logging.WARNING, logger=GENERATOR_LOGGER):
+        generator.generate(sample_pptx, slides, out)
 
     # Should complete without crashing
     assert os.path.exists(out)
 
-    # Should have printed warning
-    print_calls = [str(call) for call in mock_print.call_args_list]
-    assert any("No suitable placeholder found for chart" in call for call in print_calls)
+    # Should have logged warning
+    assert any(
+        "placeholder_not_found" in r.getMessage() and '"content": "chart"' in r.getMessage() for r in caplog.records
+    )
 
 
 def test_validate_content_type():
@@ -4,6 +4,7 @@ Tests the new Two-Column bullet handling logic added to generator.py,
 focusing on the _find_all_body_placeholders method and bullet distribution logic.
 """
 
+from dataclasses import dataclass
 from unittest.mock import Mock
 
 import pytest
@@ -12,6 +13,21 @@ from pptx.enum.shapes import PP_PLACEHOLDER
 from app.services.generator import PresentationGenerator
 
 
+@dataclass(slots=True, eq=False)
+class _PHStub:
+    """Placeholder stand-in exposing only what the generator reads.
+
+    Cheaper than a Mock tree; eq=False keeps identity comparison between stubs.
+    """
+
+    type: PP_PLACEHOLDER
+    has_text_frame: bool = True
+
+    @property
+    def placeholder_format(self):
+        return self
+
+
 class TestFindAllBodyPlaceholders:
     """Test the _find_all_body_placeholders method."""
 
@@ -21,12 +37,8 @@ class TestFindAllBodyPlaceholders:
         return PresentationGenerator()
 
     def create_mock_placeholder(self, ph_type, has_text_frame=True):
-        """Helper to create a mock placeholder."""
-        ph = Mock()
-        ph.placeholder_format = Mock()
-        ph.placeholder_format.type = ph_type
-        ph.has_text_frame = has_text_frame
-        return ph
+        """Helper to create a stub placeholder."""
+        return _PHStub(ph_type, has_text_frame)
 
     def test_find_two_body_placeholders(self, generator):
         """Test finding two BODY placeholders on a slide."""
@@ -133,6 +145,25 @@ class TestFindAllBodyPlaceholders:
         assert result[0] == ph_body1
         assert result[1] == ph_body2
 
+    def test_classify_placeholders_single_pass(self, generator):
+        """Test that classification walks placeholders once and keeps the first of each type."""
+        title = self.create_mock_placeholder(PP_PLACEHOLDER.TITLE, has_text_frame=True)
+        body1 = self.create_mock_placeholder(PP_PLACEHOLDER.BODY)
+        pic = self.create_mock_placeholder(PP_PLACEHOLDER.PICTURE, has_text_frame=False)
+        body2 = self.create_mock_placeholder(PP_PLACEHOLDER.BODY)
+        placeholders = Mock()
+        placeholders.__iter__ = Mock(return_value=iter([title, body1, pic, body2]))
+        slide = Mock()
+        slide.placeholders = placeholders
+
+        first_by_type, body_placeholders = generator._classify_placeholders(slide)
+
+        assert placeholders.__iter__.call_count == 1
+        assert body_placeholders == [body1, body2]
+        assert generator._pick_placeholder(first_by_type, [PP_PLACEHOLDER.PICTURE, PP_PLACEHOLDER.BODY]) is pic
+        assert generator._pick_placeholder(first_by_type, [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.BODY]) is body1
+        assert generator._pick_placeholder(first_by_type, [PP_PLACEHOLDER.CHART]) is None
+
 
 class TestTwoColumnLogicIntegration:
     """Integration tests for Two-Column bullet handling logic.
@@ -1,179 +1,189 @@
 """Unit tests for LayoutTemplateCatalog."""
 
+import re
+
 import pytest
 
 from app.services.layout_catalog import LAYOUT_CATALOG, LayoutTemplateCatalog
 
+# Keep the module on one xdist worker under --dist loadgroup so its module-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group("layout_catalog")
+
+_EXPECTED_LAYOUT_NAMES = (
+    "Title Slide",
+    "Title + Bullets",
+    "Section Header",
+    "Two-Column",
+    "Quote/Highlight",
+    "Bullets Only",
+    "Summary/Conclusion",
+)
+
+_LAYOUT_ID_RE = re.compile(r"Layout (\d+):")
+_MAX_CAPACITY_RE = re.compile(r"Max Capacity: (\d+)")
+_LAYOUT_SECTIONS_RE = re.compile(r"Purpose:.*Placeholders:.*Bullets:.*Text Length:", re.DOTALL)
+
 
 class TestLayoutCatalog:
     """Test the LayoutTemplateCatalog class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def catalog(self):
-        """Create a LayoutTemplateCatalog instance."""
+        """Create a LayoutTemplateCatalog instance shared by the module (tests only read from it)."""
         return LayoutTemplateCatalog()
 
-    def test_catalog_returns_7_layouts(self, catalog):
-        """Test that get_all_layouts() returns exactly 7 layout definitions."""
-        layouts = catalog.get_all_layouts()
-        assert len(layouts) == 7
-
-    def test_catalog_ids_sequential(self, catalog):
-        """Test that layout IDs are sequential from 1 to 7."""
-        layouts = catalog.get_all_layouts()
-        ids = [layout.id for layout in layouts]
-        assert ids == [1, 2, 3, 4, 5, 6, 7]
-
-    def test_catalog_ids_unique(self, catalog):
-        """Test that all layout IDs are unique."""
-        layouts = catalog.get_all_layouts()
-        ids = [layout.id for layout in layouts]
-        assert len(ids) == len(set(ids))
-
-    def test_get_layout_by_id_valid(self, catalog):
+    @pytest.fixture(scope="module")
+    def all_layouts(self, catalog):
+        """Layouts from get_all_layouts(), fetched once for the read-only tests."""
+        return catalog.get_all_layouts()
+
+    @pytest.fixture(scope="module")
+    def layout_metrics(self, all_layouts):
+        """Numeric layout fields as per-field columns, gathered in one walk over the catalog."""
+        columns = zip(
+            *(
+                (*layout.recommended_bullet_count, *layout.recommended_text_length, layout.max_text_capacity)
+                for layout in all_layouts
+            ),
+            strict=True,
+        )
+        return dict(zip(("bullet_min", "bullet_max", "text_min", "text_max", "capacity"), columns, strict=True))
+
+    @pytest.fixture(scope="module")
+    def prompt_context(self, catalog):
+        """Prompt context from get_catalog_prompt_context(), built once for the module."""
+        return catalog.get_catalog_prompt_context()
+
+    @pytest.fixture(scope="module")
+    def context_tokens(self, prompt_context):
+        """Words, layout IDs and max capacities of the prompt context, tokenized once for the module."""
+        return {
+            "words": set(prompt_context.split()),
+            "ids": set(_LAYOUT_ID_RE.findall(prompt_context)),
+            "caps": set(_MAX_CAPACITY_RE.findall(prompt_context)),
+        }
+
+    def test_catalog_id_invariants(self, all_layouts):
+        """Test that get_all_layouts() returns exactly 7 layouts with unique, sequential IDs 1-7.
+
+        Sequential from 1 implies both the count and uniqueness, so one walk checks all three.
+        """
+        assert [layout.id for layout in all_layouts] == list(range(1, 8))
+
+    def test_catalog_ids_attribute(self, catalog):
+        """Test that the precomputed ids tuple matches the layouts."""
+        assert catalog.ids == tuple(range(1, 8))
+
+    @pytest.mark.parametrize("layout_id", range(1, 8))
+    def test_get_layout_by_id_valid(self, catalog, layout_id):
         """Test that get_layout_by_id() returns correct definition for each ID 1-7."""
-        for layout_id in range(1, 8):
-            layout = catalog.get_layout_by_id(layout_id)
-            assert layout.id == layout_id
-            assert layout.name is not None
-            assert layout.description is not None
+        layout = catalog.get_layout_by_id(layout_id)
+        assert layout.id == layout_id
+        assert layout.name is not None
+        assert layout.description is not None
 
-    def test_get_layout_by_id_invalid_raises(self, catalog):
+    @pytest.mark.parametrize("invalid_id", [0, 8, -1, 100])
+    def test_get_layout_by_id_invalid_raises(self, catalog, invalid_id):
         """Test that get_layout_by_id() raises ValueError for invalid IDs."""
-        invalid_ids = [0, 8, -1, 100]
-        for invalid_id in invalid_ids:
-            with pytest.raises(ValueError, match=f"Invalid layout_type_id: {invalid_id}"):
-                catalog.get_layout_by_id(invalid_id)
+        with pytest.raises(ValueError, match=rf"Invalid layout_type_id: {re.escape(str(invalid_id))}\b"):
+            catalog.get_layout_by_id(invalid_id)
 
-    def test_catalog_capacities_positive(self, catalog):
+    def test_catalog_capacities_positive(self, layout_metrics):
         """Test that all max_text_capacity values are positive."""
-        layouts = catalog.get_all_layouts()
-        for layout in layouts:
-            assert layout.max_text_capacity > 0
+        assert min(layout_metrics["capacity"]) > 0
 
     def test_catalog_names_unique(self, catalog):
         """Test that all layout names are unique."""
-        layouts = catalog.get_all_layouts()
-        names = [layout.name for layout in layouts]
-        assert len(names) == len(set(names))
+        assert len(catalog.names) == len(set(catalog.names))
 
     def test_catalog_has_expected_layout_names(self, catalog):
         """Test that catalog contains expected layout type names."""
-        layouts = catalog.get_all_layouts()
-        names = [layout.name for layout in layouts]
-
-        expected_names = [
-            "Title Slide",
-            "Title + Bullets",
-            "Section Header",
-            "Two-Column",
-            "Quote/Highlight",
-            "Bullets Only",
-            "Summary/Conclusion",
-        ]
-
-        assert names == expected_names
+        assert catalog.names == _EXPECTED_LAYOUT_NAMES
 
     def test_two_column_layout_has_two_body_placeholders(self, catalog):
         """Test that Two-Column layout (ID 4) has two BODY placeholders."""
         two_column = catalog.get_layout_by_id(4)
         assert two_column.name == "Two-Column"
-        assert two_column.primary_placeholders.count("BODY") == 2
+        assert two_column.count_placeholder("BODY") == 2
+        assert two_column.count_placeholder("PICTURE") == 0
 
-    def test_prompt_context_contains_all_ids(self, catalog):
+    def test_prompt_context_contains_all_ids(self, context_tokens):
         """Test that get_catalog_prompt_context() includes all 7 layout IDs."""
-        context = catalog.get_catalog_prompt_context()
-
-        for layout_id in range(1, 8):
-            assert f"Layout {layout_id}:" in context
+        assert context_tokens["ids"] == {str(layout_id) for layout_id in range(1, 8)}
 
-    def test_prompt_context_contains_capacities(self, catalog):
+    @pytest.mark.parametrize("layout", LAYOUT_CATALOG, ids=lambda layout: layout.name)
+    def test_prompt_context_contains_capacities(self, layout, context_tokens):
         """Test that prompt context includes max capacity values."""
-        context = catalog.get_catalog_prompt_context()
+        assert str(layout.max_text_capacity) in context_tokens["caps"]
 
-        layouts = catalog.get_all_layouts()
-        for layout in layouts:
-            assert f"Max Capacity: {layout.max_text_capacity}" in context
+    def test_description_head_is_cached(self, catalog):
+        """Test that description_head holds the first three description words and is computed once."""
+        layout = catalog.get_layout_by_id(2)
+        assert layout.description_head == tuple(layout.description.split()[:3])
+        assert layout.description_head is layout.description_head
+        assert "description_head" not in layout.model_dump()
 
-    def test_prompt_context_format(self, catalog):
-        """Test that prompt context has expected structure."""
-        context = catalog.get_catalog_prompt_context()
+    def test_prompt_context_is_cached(self, catalog):
+        """Test that repeated calls reuse the string built on the first call."""
+        assert catalog.get_catalog_prompt_context() is catalog.get_catalog_prompt_context()
 
+    def test_prompt_context_format(self, prompt_context):
+        """Test that prompt context has expected structure."""
         # Should start with header
-        assert context.startswith("Available Layout Types:")
+        assert prompt_context.startswith("Available Layout Types:")
 
         # Should be non-empty
-        assert len(context) > 100
+        assert len(prompt_context) > 100
 
-        # Should contain key sections for each layout
-        assert "Purpose:" in context
-        assert "Placeholders:" in context
-        assert "Bullets:" in context
-        assert "Text Length:" in context
+        # Should contain key sections for each layout, in order (one scan)
+        assert _LAYOUT_SECTIONS_RE.search(prompt_context)
 
-    def test_prompt_context_includes_layout_names(self, catalog):
+    @pytest.mark.parametrize("layout", LAYOUT_CATALOG, ids=lambda layout: layout.name)
+    def test_prompt_context_includes_layout_names(self, layout, prompt_context):
         """Test that prompt context includes all layout names."""
-        context = catalog.get_catalog_prompt_context()
+        assert layout.name in prompt_context
 
-        layouts = catalog.get_all_layouts()
-        for layout in layouts:
-            assert layout.name in context
-
-    def test_prompt_context_includes_descriptions(self, catalog):
+    @pytest.mark.parametrize("layout", LAYOUT_CATALOG, ids=lambda layout: layout.name)
+    def test_prompt_context_includes_descriptions(self, layout, context_tokens):
         """Test that prompt context includes layout descriptions."""
-        context = catalog.get_catalog_prompt_context()
-
-        layouts = catalog.get_all_layouts()
-        for layout in layouts:
-            # Check that at least part of the description is present
-            # (descriptions might be long, so we check for the first few words)
-            desc_start = layout.description.split()[:3]
-            assert any(word in context for word in desc_start)
+        # Check that at least part of the description is present
+        # (descriptions might be long, so we check for the first few words)
+        assert set(layout.description_head) <= context_tokens["words"]
 
-    def test_get_all_layouts_returns_copy(self, catalog):
-        """Test that get_all_layouts() returns a copy, not the original list."""
+    def test_get_all_layouts_returns_shared_tuple(self, catalog):
+        """Test that get_all_layouts() returns one immutable tuple instead of a fresh list copy."""
         layouts1 = catalog.get_all_layouts()
         layouts2 = catalog.get_all_layouts()
 
-        # Should be equal in content
-        assert len(layouts1) == len(layouts2)
+        # Immutable, so sharing it across callers is safe
+        assert isinstance(layouts1, tuple)
+        assert layouts1 is layouts2
 
-        # But not the same object
-        assert layouts1 is not layouts2
+        # It is the (lazily built) module-level catalog itself
+        assert layouts1 is LAYOUT_CATALOG
 
     def test_catalog_constant_has_7_layouts(self):
         """Test that LAYOUT_CATALOG constant has exactly 7 layouts."""
         assert len(LAYOUT_CATALOG) == 7
 
-    def test_catalog_constant_ids_valid(self):
+    @pytest.mark.parametrize("layout", LAYOUT_CATALOG, ids=lambda layout: layout.name)
+    def test_catalog_constant_ids_valid(self, layout):
         """Test that LAYOUT_CATALOG has valid IDs (1-7)."""
-        ids = [layout.id for layout in LAYOUT_CATALOG]
-        assert all(1 <= id <= 7 for id in ids)
+        assert 1 <= layout.id <= 7
 
-    def test_recommended_bullet_counts_valid(self, catalog):
+    def test_recommended_bullet_counts_valid(self, layout_metrics):
         """Test that recommended bullet counts are valid (min <= max)."""
-        layouts = catalog.get_all_layouts()
-        for layout in layouts:
-            min_bullets, max_bullets = layout.recommended_bullet_count
-            assert min_bullets <= max_bullets
-            assert min_bullets >= 0
-            assert max_bullets >= 0
-
-    def test_recommended_text_lengths_valid(self, catalog):
+        assert all(
+            0 <= lo <= hi for lo, hi in zip(layout_metrics["bullet_min"], layout_metrics["bullet_max"], strict=True)
+        )
+
+    def test_recommended_text_lengths_valid(self, layout_metrics):
         """Test that recommended text lengths are valid (min <= max)."""
-        layouts = catalog.get_all_layouts()
-        for layout in layouts:
-            min_length, max_length = layout.recommended_text_length
-            assert min_length <= max_length
-            assert min_length > 0
-            assert max_length > 0
-
-    def test_max_capacity_exceeds_recommended_max(self, catalog):
+        assert all(0 < lo <= hi for lo, hi in zip(layout_metrics["text_min"], layout_metrics["text_max"], strict=True))
+
+    def test_max_capacity_exceeds_recommended_max(self, layout_metrics):
         """Test that max_text_capacity is >= recommended max text length."""
-        layouts = catalog.get_all_layouts()
-        for layout in layouts:
-            _, max_recommended = layout.recommended_text_length
-            assert layout.max_text_capacity >= max_recommended
+        assert all(cap >= hi for cap, hi in zip(layout_metrics["capacity"], layout_metrics["text_max"], strict=True))
 
 
 # Made with Bob
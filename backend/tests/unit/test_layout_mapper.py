@@ -7,16 +7,16 @@ based on placeholder analysis and fallback logic.
 import pytest
 
 from app.schemas import LayoutInfo, LayoutTypeDefinition, PlaceholderInfo
-from app.services.layout_mapper import FALLBACK_PRIORITY, LayoutTypeMapper
+from app.services.layout_mapper import FALLBACK_CHAINS, FALLBACK_PRIORITY, LayoutTypeMapper
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mapper():
     """Create a LayoutTypeMapper instance."""
     return LayoutTypeMapper()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def catalog():
     """Create a minimal catalog of layout type definitions."""
     return [
@@ -77,7 +77,7 @@ def catalog():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_template_layouts():
     """Create a default template with all 7 layout types represented."""
     return [
@@ -146,7 +146,7 @@ def default_template_layouts():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_template_layouts():
     """Create a minimal template with only one layout."""
     return [
@@ -376,4 +376,10 @@ def test_fallback_priority_matrix_defined():
     assert FALLBACK_PRIORITY[7] == [2, 6]
 
 
+def test_fallback_chains_start_with_requested_type():
+    """Test that FALLBACK_CHAINS is each type followed by its FALLBACK_PRIORITY chain."""
+    assert FALLBACK_CHAINS.keys() == FALLBACK_PRIORITY.keys()
+    assert all(FALLBACK_CHAINS[type_id] == (type_id, *chain) for type_id, chain in FALLBACK_PRIORITY.items())
+
+
 # Made with Bob
@@ -44,3 +44,14 @@ def test_get_llm_provider_case_insensitive():
         with patch("beeai_framework.backend.chat.ChatModel.from_name") as mock_from_name:
             get_llm()
             mock_from_name.assert_called_with("ollama:llama3.1")
+
+
+def test_get_llm_reuses_model_per_provider_and_model():
+    with patch.dict(os.environ, {"LLM_PROVIDER": "ollama", "LLM_MODEL": "llama3.1"}, clear=True):
+        with patch("beeai_framework.backend.chat.ChatModel.from_name") as mock_from_name:
+            assert get_llm() is get_llm()
+            mock_from_name.assert_called_once_with("ollama:llama3.1")
+
+            os.environ["LLM_MODEL"] = "granite"
+            get_llm()
+            assert mock_from_name.call_count == 2
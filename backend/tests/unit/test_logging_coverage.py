@@ -43,6 +43,27 @@ def test_sensitive_data_filter_edge_cases():
     assert record.args == (123, {"key": "val"})
 
 
+def test_sensitive_data_filter_applies_patterns_in_order():
+    """Test that a match swallowing a later key name does not leave that key's value unredacted"""
+    log_filter = SensitiveDataFilter()
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="x" * 50 + "api-key: 'zz' token=a.b.capi_key=abc123",
+        args=("clean message",),
+        exc_info=None,
+    )
+
+    log_filter.filter(record)
+
+    assert "zz" not in record.msg
+    assert "abc123" not in record.msg
+    # Strings without sensitive data are passed through untouched
+    assert record.args == ("clean message",)
+
+
 def test_sanitize_dict_edge_cases():
     """Test sanitize_dict with comprehensive edge cases"""
     data = {
@@ -67,6 +88,20 @@ def test_sanitize_dict_edge_cases():
     assert sanitized["mixed"]["number"] == 42
 
 
+def test_sanitize_dict_copies_only_changed_branches():
+    """Test that clean branches are returned as-is and the input is left unmodified"""
+    clean = {"event": "user_action", "meta": {"count": 1}, "items": [{"name": "a"}]}
+    assert sanitize_dict(clean) is clean
+
+    data = {"meta": {"count": 1}, "users": [{"token": "abc"}, {"name": "b"}]}
+    sanitized = sanitize_dict(data)
+
+    assert sanitized["users"][0]["token"] == "***REDACTED***"
+    assert data["users"][0]["token"] == "abc"
+    assert sanitized["meta"] is data["meta"]
+    assert sanitized["users"][1] is data["users"][1]
+
+
 def test_sensitive_data_processor():
     """Test SensitiveDataProcessor for structlog"""
     processor = SensitiveDataProcessor()
@@ -3,24 +3,17 @@
 from unittest.mock import patch
 
 import pytest
-from fastapi.testclient import TestClient
 
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test the root endpoint returns correct message"""
-    from app.main import app
-
-    client = TestClient(app)
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {"message": "Hello from PowerPoint Generator Agent"}
 
 
-def test_health_check_endpoint():
+def test_health_check_endpoint(client):
     """Test the health check endpoint returns ok status"""
-    from app.main import app
-
-    client = TestClient(app)
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
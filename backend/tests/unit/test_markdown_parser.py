@@ -3,10 +3,108 @@
 Target coverage: 95%
 """
 
+from functools import lru_cache
+
 import pytest
 
 from app.services.markdown_parser import MarkdownParser, SlideBuilder
 
+# Markdown inputs shared by the parser tests; each distinct input is parsed at most once per module (see parsed)
+_MD_SIMPLE = """# My Presentation
+
+## Introduction
+
+This is the introduction.
+
+## Conclusion
+
+Summary of key points.
+"""
+
+_MD_HEADING_ONLY = """# Presentation
+
+## Slide 1
+"""
+
+_MD_BULLETS = """# Presentation
+
+## Features
+
+- Feature 1
+- Feature 2
+- Feature 3
+"""
+
+_MD_ORDERED = """# Presentation
+
+## Steps
+
+1. First step
+2. Second step
+3. Third step
+"""
+
+_MD_CODE_BLOCK = """# Presentation
+
+## Code Example
+
+```python
+def hello():
+    print("Hello")
+```
+"""
+
+_MD_INLINE_CODE = """# Presentation
+
+## Code
+
+- Use `print()` function
+"""
+
+_MD_NESTED = """# Presentation
+
+## Topics
+
+- Main point
+  - Sub point 1
+  - Sub point 2
+- Another main
+"""
+
+_MD_IMAGE = """# Presentation
+
+## Diagram
+
+![Architecture](https://example.com/diagram.png)
+"""
+
+_MD_MULTIPLE_IMAGES = """# Presentation
+
+## Images
+
+![First](https://example.com/first.png)
+![Second](https://example.com/second.png)
+"""
+
+_MD_INVALID_IMAGE = """# Presentation
+
+## Slide
+
+![Invalid](ftp://invalid.com/image.png)
+"""
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """Create a MarkdownParser shared by the module (parse() keeps no state between calls)."""
+    return MarkdownParser()
+
+
+@pytest.fixture(scope="module")
+def parsed(parser):
+    """parser.parse memoized per input, for tests that only read the result."""
+    return lru_cache(maxsize=None)(parser.parse)
+
 
 class TestSlideBuilder:
     """Tests for the SlideBuilder class."""
@@ -95,170 +193,69 @@ class TestSlideBuilder:
 class TestMarkdownParser:
     """Tests for the MarkdownParser class."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = MarkdownParser()
-
-    def test_parse_simple_presentation(self):
-        """Test parsing a simple presentation."""
-        markdown = """# My Presentation
-
-## Introduction
-
-This is the introduction.
-
-## Conclusion
-
-Summary of key points.
-"""
-        result = self.parser.parse(markdown)
-        assert result.presentation_title == "My Presentation"
-        assert len(result.slides) == 2
-        assert result.slides[0].title == "Introduction"
-        assert result.slides[1].title == "Conclusion"
-
-    def test_parse_with_bullet_points(self):
-        """Test parsing bullet points."""
-        markdown = """# Presentation
-
-## Features
-
-- Feature 1
-- Feature 2
-- Feature 3
-"""
-        result = self.parser.parse(markdown)
-        assert len(result.slides) == 1
-        assert result.slides[0].bullets is not None
-        assert len(result.slides[0].bullets) == 3
-        assert result.slides[0].bullets[0].text == "Feature 1"
-
-    def test_parse_with_nested_bullets(self):
+    @pytest.mark.parametrize(
+        ("markdown", "expected_title", "expected_slide_titles"),
+        [
+            pytest.param(_MD_SIMPLE, "My Presentation", ["Introduction", "Conclusion"], id="simple_presentation"),
+            pytest.param(_MD_HEADING_ONLY, "Presentation", ["Slide 1"], id="heading_only_slide"),
+        ],
+    )
+    def test_parse_slide_titles(self, parsed, markdown, expected_title, expected_slide_titles):
+        """Test that H1 sets the presentation title and each H2 becomes a slide."""
+        result = parsed(markdown)
+        assert result.presentation_title == expected_title
+        assert [slide.title for slide in result.slides] == expected_slide_titles
+
+    @pytest.mark.parametrize(
+        ("markdown", "expected_count", "expected_first_text"),
+        [
+            pytest.param(_MD_BULLETS, 3, "Feature 1", id="bullet_points"),
+            pytest.param(_MD_ORDERED, 3, "First step", id="ordered_list"),
+            pytest.param(_MD_CODE_BLOCK, 1, 'print("Hello")', id="code_block_as_plain_text"),
+            pytest.param(_MD_INLINE_CODE, 1, "print()", id="inline_code"),
+        ],
+    )
+    def test_parse_bullets(self, parsed, markdown, expected_count, expected_first_text):
+        """Test that list items and code become bullets on the slide."""
+        bullets = parsed(markdown).slides[0].bullets
+        assert bullets is not None
+        assert len(bullets) == expected_count
+        assert expected_first_text in bullets[0].text
+
+    def test_parse_with_nested_bullets(self, parsed):
         """Test parsing nested bullet points."""
-        markdown = """# Presentation
-
-## Topics
-
-- Main point
-  - Sub point 1
-  - Sub point 2
-- Another main
-"""
-        result = self.parser.parse(markdown)
+        result = parsed(_MD_NESTED)
         assert result.slides[0].bullets is not None
         # Check that we have bullets with different levels
         levels = [b.level for b in result.slides[0].bullets]
         assert 0 in levels
         assert 1 in levels
 
-    def test_parse_with_image(self):
-        """Test parsing image references."""
-        markdown = """# Presentation
-
-## Diagram
-
-![Architecture](https://example.com/diagram.png)
-"""
-        result = self.parser.parse(markdown)
-        assert result.slides[0].image_url == "https://example.com/diagram.png"
-
-    def test_parse_with_code_block(self):
-        """Test parsing code blocks as plain text."""
-        markdown = """# Presentation
-
-## Code Example
-
-```python
-def hello():
-    print("Hello")
-```
-"""
-        result = self.parser.parse(markdown)
-        assert result.slides[0].bullets is not None
-        assert len(result.slides[0].bullets) > 0
-
-    def test_parse_empty_content_raises_error(self):
-        """Test parsing empty content raises MarkdownSyntaxError."""
-        from app.exceptions import MarkdownSyntaxError
-
-        with pytest.raises(MarkdownSyntaxError):
-            self.parser.parse("")
-
-    def test_parse_only_title_raises_error(self):
-        """Test parsing content with only a title raises error."""
-        from app.exceptions import MarkdownSyntaxError
-
-        markdown = "# Just a Title"
-        with pytest.raises(MarkdownSyntaxError):
-            self.parser.parse(markdown)
-
-    def test_parse_returns_warnings(self):
+    @pytest.mark.parametrize(
+        ("markdown", "expected_url"),
+        [
+            pytest.param(_MD_IMAGE, "https://example.com/diagram.png", id="single_image"),
+            pytest.param(_MD_MULTIPLE_IMAGES, "https://example.com/first.png", id="multiple_images_uses_first"),
+        ],
+    )
+    def test_parse_image_url(self, parsed, markdown, expected_url):
+        """Test that the first image reference becomes the slide image."""
+        result = parsed(markdown)
+        assert result.slides[0].image_url == expected_url
+
+    def test_parse_returns_warnings(self, parsed):
         """Test that warnings are returned for invalid URLs."""
-        markdown = """# Presentation
-
-## Slide
-
-![Invalid](ftp://invalid.com/image.png)
-"""
-        result = self.parser.parse(markdown)
+        result = parsed(_MD_INVALID_IMAGE)
         assert len(result.warnings) == 1
 
-    def test_slide_layout_index_defaults_to_1(self):
+    def test_slide_layout_index_defaults_to_1(self, parsed):
         """Test that slides default to layout index 1."""
-        markdown = """# Presentation
-
-## Slide 1
-"""
-        result = self.parser.parse(markdown)
+        result = parsed(_MD_HEADING_ONLY)
         assert result.slides[0].layout_index == 1
 
-    def test_parse_ordered_list(self):
-        """Test parsing ordered lists."""
-        markdown = """# Presentation
-
-## Steps
-
-1. First step
-2. Second step
-3. Third step
-"""
-        result = self.parser.parse(markdown)
-        assert result.slides[0].bullets is not None
-        assert len(result.slides[0].bullets) == 3
-
-    def test_parse_inline_code(self):
-        """Test parsing inline code in text."""
-        markdown = """# Presentation
-
-## Code
-
-- Use `print()` function
-"""
-        result = self.parser.parse(markdown)
-        assert result.slides[0].bullets is not None
-        assert "print()" in result.slides[0].bullets[0].text
-
-    def test_parse_multiple_images_uses_first(self):
-        """Test that only the first image is used per slide."""
-        markdown = """# Presentation
-
-## Images
-
-![First](https://example.com/first.png)
-![Second](https://example.com/second.png)
-"""
-        result = self.parser.parse(markdown)
-        assert result.slides[0].image_url == "https://example.com/first.png"
-
-    def test_response_model_is_valid(self):
+    def test_response_model_is_valid(self, parsed):
         """Test that the response is a valid MarkdownParseResponse."""
-        markdown = """# Test
-
-## Slide 1
-
-- Point 1
-"""
-        result = self.parser.parse(markdown)
+        result = parsed(_MD_BULLETS)
         assert hasattr(result, "presentation_title")
         assert hasattr(result, "slides")
         assert hasattr(result, "warnings")
@@ -267,51 +264,24 @@ def hello():
 class TestMarkdownParserErrors:
     """Tests for MarkdownParser error handling [REQ-5.2]."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.parser = MarkdownParser()
-
-    def test_parse_empty_content_raises_error(self):
-        """Test that empty content raises MarkdownSyntaxError."""
-        from app.exceptions import MarkdownSyntaxError
-
-        with pytest.raises(MarkdownSyntaxError) as exc_info:
-            self.parser.parse("")
-
-        assert exc_info.value.line == 1
-        assert exc_info.value.column == 1
-        assert "Empty" in exc_info.value.message
-
-    def test_parse_whitespace_only_raises_error(self):
-        """Test that whitespace-only content raises MarkdownSyntaxError."""
-        from app.exceptions import MarkdownSyntaxError
-
-        with pytest.raises(MarkdownSyntaxError) as exc_info:
-            self.parser.parse("   \n\n  \t  ")
-
-        assert exc_info.value.line == 1
-        assert exc_info.value.column == 1
-        assert "Empty" in exc_info.value.message
-
-    def test_parse_no_slides_raises_error(self):
-        """Test that content without ## headings raises error."""
+    @pytest.mark.parametrize(
+        ("markdown", "expected_message"),
+        [
+            pytest.param("", "Empty", id="empty"),
+            pytest.param("   \n\n  \t  ", "Empty", id="whitespace_only"),
+            pytest.param(
+                "# Presentation Title\n\nSome text but no slides", "No slides found. Use '## Heading'", id="no_slides"
+            ),
+            pytest.param("# Just a Title", "No slides found", id="only_h1"),
+        ],
+    )
+    def test_parse_invalid_content_raises_error(self, parser, markdown, expected_message):
+        """Test that empty content or content without ## headings raises MarkdownSyntaxError at 1:1."""
         from app.exceptions import MarkdownSyntaxError
 
-        markdown = "# Presentation Title\n\nSome text but no slides"
         with pytest.raises(MarkdownSyntaxError) as exc_info:
-            self.parser.parse(markdown)
+            parser.parse(markdown)
 
         assert exc_info.value.line == 1
         assert exc_info.value.column == 1
-        assert "No slides found" in exc_info.value.message
-        assert "## Heading" in exc_info.value.message
-
-    def test_parse_only_h1_no_slides_raises_error(self):
-        """Test that content with only H1 heading raises error."""
-        from app.exceptions import MarkdownSyntaxError
-
-        markdown = "# Just a Title"
-        with pytest.raises(MarkdownSyntaxError) as exc_info:
-            self.parser.parse(markdown)
-
-        assert "No slides found" in exc_info.value.message
+        assert expected_message in exc_info.value.message
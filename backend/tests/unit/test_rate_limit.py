@@ -1,5 +1,6 @@
 """Tests for rate limiting middleware"""
 
+import json
 from unittest.mock import MagicMock
 
 import pytest
@@ -8,62 +9,64 @@ from starlette.responses import JSONResponse
 
 from app.middleware.rate_limit import limiter, rate_limit_exceeded_handler
 
+_GET_SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "path": "/api/test",
+    "query_string": b"",
+    "headers": [],
+}
 
-class TestRateLimitMiddleware:
-    """Test rate limiting middleware functionality"""
+_POST_SCOPE = {
+    "type": "http",
+    "method": "POST",
+    "path": "/api/research",
+    "query_string": b"topic=test",
+    "headers": [],
+}
 
-    def _create_mock_rate_limit_exc(self):
-        """Create a mock RateLimitExceeded exception"""
-        from slowapi.errors import RateLimitExceeded
 
-        # Create a mock Limit object
-        mock_limit = MagicMock()
-        mock_limit.error_message = None
-        mock_limit.limit = "10/minute"
+@pytest.fixture(scope="module")
+def rate_limit_exc():
+    """Create a mock RateLimitExceeded exception shared by the module (the handler only reads it)"""
+    from slowapi.errors import RateLimitExceeded
 
-        exc = RateLimitExceeded.__new__(RateLimitExceeded)
-        exc.limit = mock_limit
-        exc.status_code = 429
-        exc.detail = "Rate limit exceeded"
-        return exc
+    # Create a mock Limit object
+    mock_limit = MagicMock()
+    mock_limit.error_message = None
+    mock_limit.limit = "10/minute"
+
+    exc = RateLimitExceeded.__new__(RateLimitExceeded)
+    exc.limit = mock_limit
+    exc.status_code = 429
+    exc.detail = "Rate limit exceeded"
+    return exc
+
+
+@pytest.fixture(scope="module", params=[_GET_SCOPE, _POST_SCOPE], ids=["get", "post"])
+def rate_limited_request(request):
+    """Starlette Request that hit the limit, built once per HTTP method"""
+    return Request(request.param)
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_exceeded_handler_returns_429(self):
-        """Rate limit exceeded handler should return 429 status code"""
-        scope = {
-            "type": "http",
-            "method": "GET",
-            "path": "/api/test",
-            "query_string": b"",
-            "headers": [],
-        }
-        request = Request(scope)
-        exc = self._create_mock_rate_limit_exc()
-
-        response = await rate_limit_exceeded_handler(request, exc)
-
-        assert isinstance(response, JSONResponse)
-        assert response.status_code == 429
-
-    @pytest.mark.asyncio
-    async def test_rate_limit_exceeded_handler_response_content(self):
-        """Rate limit exceeded handler should return proper error message"""
-        import json
 
-        scope = {
-            "type": "http",
-            "method": "POST",
-            "path": "/api/research",
-            "query_string": b"topic=test",
-            "headers": [],
-        }
-        request = Request(scope)
-        exc = self._create_mock_rate_limit_exc()
+@pytest.fixture(scope="module")
+async def rate_limit_response(rate_limited_request, rate_limit_exc):
+    """Handler response for each request; the handler is deterministic, so the assertions share one call"""
+    return await rate_limit_exceeded_handler(rate_limited_request, rate_limit_exc)
 
-        response = await rate_limit_exceeded_handler(request, exc)
 
+class TestRateLimitMiddleware:
+    """Test rate limiting middleware functionality"""
+
+    def test_rate_limit_exceeded_handler_returns_429(self, rate_limit_response):
+        """Rate limit exceeded handler should return 429 status code"""
+        assert isinstance(rate_limit_response, JSONResponse)
+        assert rate_limit_response.status_code == 429
+
+    def test_rate_limit_exceeded_handler_response_content(self, rate_limit_response):
+        """Rate limit exceeded handler should return proper error message"""
         # Parse response body
-        content = json.loads(response.body.decode())
+        content = json.loads(rate_limit_response.body.decode())
 
         assert "error" in content
         assert content["error"] == "Rate limit exceeded"
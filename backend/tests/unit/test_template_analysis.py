@@ -1,4 +1,4 @@
-import os
+from io import BytesIO
 
 import pytest
 from pptx import Presentation
@@ -7,26 +7,24 @@ from app.services.template import TemplateAnalyzer
 
 
 @pytest.fixture
-def sample_pptx():
-    # Create a dummy PPTX file
-    prs = Presentation()
+def sample_pptx(sample_pptx_bytes, tmp_path):
+    # Create a dummy PPTX file from the session-cached default template
+    prs = Presentation(BytesIO(sample_pptx_bytes))
     title_slide_layout = prs.slide_layouts[0]
     slide = prs.slides.add_slide(title_slide_layout)
     title = slide.shapes.title
     title.text = "Hello, World!"
 
-    filename = "test_template.pptx"
+    filename = str(tmp_path / "test_template.pptx")
     prs.save(filename)
-    yield filename
-    if os.path.exists(filename):
-        os.remove(filename)
+    return filename
 
 
 def test_analyze_template(sample_pptx):
     analyzer = TemplateAnalyzer()
     result = analyzer.analyze(sample_pptx)
 
-    assert result.filename == sample_pptx
+    assert result.filename == "test_template.pptx"
     assert len(result.masters) > 0
     # Basic check ensuring we got layouts back
     assert len(result.masters[0].layouts) > 0